@@ -31,6 +31,16 @@ class Settings(BaseSettings):
         description="Company relevance threshold (lower than opinion/news threshold)"
     )
 
+    # Inference
+    onnx_runtime: bool = Field(
+        default=False,
+        description="Serve the MNLI detectors' own pipelines from an exported ONNX Runtime model (requires the onnx extra)"
+    )
+    onnx_quantize_int8: bool = Field(
+        default=False,
+        description="Run the routine and strategic detectors' own pipelines on an int8-quantized ONNX model (requires the onnx extra)"
+    )
+
     # API Configuration
     api_host: str = Field(default="0.0.0.0", description="API host to bind to")
     api_port: int = Field(default=8002, ge=1, le=65535, description="API port to bind to")
@@ -60,3 +70,5 @@ settings = Settings()
 MODEL_NAME: str = settings.model_name
 CLASSIFICATION_THRESHOLD: float = settings.classification_threshold
 COMPANY_RELEVANCE_THRESHOLD: float = settings.company_relevance_threshold
+ONNX_RUNTIME: bool = settings.onnx_runtime
+ONNX_QUANTIZE_INT8: bool = settings.onnx_quantize_int8
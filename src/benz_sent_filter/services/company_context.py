@@ -0,0 +1,136 @@
+"""Company financial context shared by the routine operation detectors.
+
+Both the pattern-based and the MNLS routine detectors judge materiality
+against the same per-company figures, so the table lives here once.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+
+
+@dataclass(frozen=True, slots=True)
+class CompanyContext:
+    """Company financial context for materiality assessment.
+
+    Attributes:
+        market_cap: Market capitalization in USD
+        annual_revenue: Annual revenue in USD
+        total_assets: Total assets in USD
+    """
+
+    market_cap: float
+    annual_revenue: float
+    total_assets: float
+
+
+# Financial context by ticker symbol. Read-only, so detectors shared across
+# callers (and tests) cannot alter each other's materiality assessment.
+COMPANY_CONTEXT = MappingProxyType(
+    {
+        "FNMA": CompanyContext(
+            market_cap=4_000_000_000,
+            annual_revenue=25_000_000_000,
+            total_assets=4_000_000_000_000,
+        ),
+        "BAC": CompanyContext(
+            market_cap=300_000_000_000,
+            annual_revenue=100_000_000_000,
+            total_assets=3_000_000_000_000,
+        ),
+        "JPM": CompanyContext(
+            market_cap=450_000_000_000,
+            annual_revenue=150_000_000_000,
+            total_assets=3_800_000_000_000,
+        ),
+        "WFC": CompanyContext(
+            market_cap=180_000_000_000,
+            annual_revenue=85_000_000_000,
+            total_assets=1_900_000_000_000,
+        ),
+        "C": CompanyContext(
+            market_cap=100_000_000_000,
+            annual_revenue=75_000_000_000,
+            total_assets=2_400_000_000_000,
+        ),
+        "GS": CompanyContext(
+            market_cap=110_000_000_000,
+            annual_revenue=48_000_000_000,
+            total_assets=1_600_000_000_000,
+        ),
+        "MS": CompanyContext(
+            market_cap=150_000_000_000,
+            annual_revenue=54_000_000_000,
+            total_assets=1_200_000_000_000,
+        ),
+        "USB": CompanyContext(
+            market_cap=75_000_000_000,
+            annual_revenue=24_000_000_000,
+            total_assets=650_000_000_000,
+        ),
+        "PNC": CompanyContext(
+            market_cap=65_000_000_000,
+            annual_revenue=20_000_000_000,
+            total_assets=560_000_000_000,
+        ),
+        "TFC": CompanyContext(
+            market_cap=55_000_000_000,
+            annual_revenue=18_000_000_000,
+            total_assets=530_000_000_000,
+        ),
+        "BK": CompanyContext(
+            market_cap=45_000_000_000,
+            annual_revenue=16_000_000_000,
+            total_assets=430_000_000_000,
+        ),
+        "STT": CompanyContext(
+            market_cap=28_000_000_000,
+            annual_revenue=12_000_000_000,
+            total_assets=300_000_000_000,
+        ),
+        "COF": CompanyContext(
+            market_cap=55_000_000_000,
+            annual_revenue=32_000_000_000,
+            total_assets=470_000_000_000,
+        ),
+        "AXP": CompanyContext(
+            market_cap=150_000_000_000,
+            annual_revenue=52_000_000_000,
+            total_assets=240_000_000_000,
+        ),
+        "SCHW": CompanyContext(
+            market_cap=120_000_000_000,
+            annual_revenue=20_000_000_000,
+            total_assets=460_000_000_000,
+        ),
+        "BLK": CompanyContext(
+            market_cap=130_000_000_000,
+            annual_revenue=19_000_000_000,
+            total_assets=180_000_000_000,
+        ),
+        "FHLMC": CompanyContext(
+            market_cap=3_500_000_000,
+            annual_revenue=22_000_000_000,
+            total_assets=3_200_000_000_000,
+        ),
+        "AIG": CompanyContext(
+            market_cap=48_000_000_000,
+            annual_revenue=50_000_000_000,
+            total_assets=580_000_000_000,
+        ),
+        "PRU": CompanyContext(
+            market_cap=38_000_000_000,
+            annual_revenue=58_000_000_000,
+            total_assets=900_000_000_000,
+        ),
+        "MET": CompanyContext(
+            market_cap=50_000_000_000,
+            annual_revenue=68_000_000_000,
+            total_assets=750_000_000_000,
+        ),
+        "ALL": CompanyContext(
+            market_cap=40_000_000_000,
+            annual_revenue=52_000_000_000,
+            total_assets=130_000_000_000,
+        ),
+    }
+)
@@ -15,9 +15,12 @@ import time
 from typing import Optional
 
 from loguru import logger
-from transformers import pipeline
 
 from benz_sent_filter.models.classification import QuantitativeCatalystResult
+from benz_sent_filter.services.zero_shot_pipeline import (
+    ZeroShotScoreCache,
+    create_zero_shot_pipeline,
+)
 
 
 class QuantitativeCatalystDetectorMNLS:
@@ -50,9 +53,15 @@ class QuantitativeCatalystDetectorMNLS:
     # Type classification threshold
     TYPE_THRESHOLD = 0.6  # Minimum score to assign specific type
 
+    # Maximum number of (headline, label) MNLI scores kept in the LRU cache
+    SCORE_CACHE_SIZE = 1024
+
     # MNLI labels for catalyst type classification
     # Tuned for DeBERTa-v3-large to distinguish directionality and transaction types
     # Key improvements: directional clarity (buying vs selling, returning vs raising capital)
+    # Labels are handed to the (possibly shared) pipeline as plain strings; the pipeline
+    # tokenizes each premise/hypothesis pair together, so hypothesis token IDs are not
+    # cached here. Repeated headlines are served from the score cache instead.
     CATALYST_TYPE_LABELS = {
         "dividend": [
             "This announces that the company is returning capital to shareholders by paying out a cash dividend or distribution",
@@ -84,6 +93,10 @@ class QuantitativeCatalystDetectorMNLS:
         re.IGNORECASE,
     )
 
+    # "per share" suffix that DOLLAR_PATTERN misses (e.g. "$10 Per Share" after a
+    # plain amount); matched against the text following a dollar amount
+    PER_SHARE_PATTERN = re.compile(r"\s+per\s+share", re.IGNORECASE)
+
     # Percentage pattern (context-aware - only near financial keywords)
     PERCENTAGE_PATTERN = re.compile(r"\b(\d+(?:\.\d+)?)\s*%", re.IGNORECASE)
 
@@ -104,9 +117,11 @@ class QuantitativeCatalystDetectorMNLS:
             # Share existing pipeline (pipeline reuse pattern)
             self._pipeline = pipeline
         else:
-            # Create new pipeline
-            from transformers import pipeline as create_pipeline
-            self._pipeline = create_pipeline("zero-shot-classification", model=model_name)
+            # Create new pipeline (ONNX Runtime when available, else PyTorch)
+            self._pipeline = create_zero_shot_pipeline(model_name)
+
+        # LRU cache of positive-label scores keyed by (headline, positive label)
+        self._score_cache = ZeroShotScoreCache(self.SCORE_CACHE_SIZE)
 
     def detect(self, headline: Optional[str]) -> QuantitativeCatalystResult:
         """Detect quantitative catalyst in headline.
@@ -117,48 +132,111 @@ class QuantitativeCatalystDetectorMNLS:
         Returns:
             QuantitativeCatalystResult with detection details
         """
-        logger.debug(
-            "Starting quantitative catalyst detection",
-            headline_length=len(headline) if headline else 0,
-        )
+        return self.detect_batch([headline])[0]
+
+    def detect_batch(
+        self, headlines: list[Optional[str]]
+    ) -> list[QuantitativeCatalystResult]:
+        """Detect quantitative catalysts in multiple headlines.
+
+        Runs each MNLI stage (presence, then type classification) as a single
+        batched pipeline call across all headlines that reach that stage,
+        instead of one forward pass per headline.
+
+        Args:
+            headlines: News article headlines to analyze
+
+        Returns:
+            List of QuantitativeCatalystResult in same order as input
+        """
+        logger.debug("Starting quantitative catalyst detection", batch_size=len(headlines))
         start_time = time.time()
 
+        results: list[Optional[QuantitativeCatalystResult]] = [None] * len(headlines)
+
         # Handle None/empty input
-        if not headline:
-            logger.warning("Empty headline provided for quantitative catalyst detection")
-            return QuantitativeCatalystResult(
-                headline=headline or "",
-                has_quantitative_catalyst=False,
-                catalyst_type=None,
-                catalyst_values=[],
-                confidence=0.0,
-            )
+        pending = []
+        for index, headline in enumerate(headlines):
+            if not headline:
+                logger.warning("Empty headline provided for quantitative catalyst detection")
+                results[index] = self._negative_result(headline or "")
+            elif "$" not in headline and "%" not in headline:
+                # Values are only ever extracted from "$" amounts or percentages,
+                # so without either the result is negative regardless of MNLI
+                logger.info(
+                    "Quantitative catalyst not detected (no dollar or percent values)"
+                )
+                results[index] = self._negative_result(headline)
+            else:
+                pending.append(index)
 
-        # Step 1: MNLI presence check
-        logger.debug("Running MNLI presence detection")
-        presence_score = self._check_presence(headline)
-        logger.debug(
-            "MNLI presence detection completed", presence_score=round(presence_score, 3)
-        )
+        # Step 1: MNLI presence check (one batched call)
+        logger.debug("Running MNLI presence detection", batch_size=len(pending))
+        presence_scores = self._check_presence_batch([headlines[i] for i in pending])
 
-        # Fast path: If MNLI says not a catalyst, return negative result
-        if presence_score < self.PRESENCE_THRESHOLD:
-            duration = time.time() - start_time
-            logger.info(
-                "Quantitative catalyst not detected (presence score below threshold)",
+        candidates = []
+        for index, presence_score in zip(pending, presence_scores):
+            headline = headlines[index]
+            logger.debug(
+                "MNLI presence detection completed",
                 presence_score=round(presence_score, 3),
-                threshold=self.PRESENCE_THRESHOLD,
-                duration_ms=round(duration * 1000, 2),
             )
-            return QuantitativeCatalystResult(
-                headline=headline,
-                has_quantitative_catalyst=False,
-                catalyst_type=None,
-                catalyst_values=[],
-                confidence=0.0,
+
+            # Fast path: If MNLI says not a catalyst, return negative result
+            if presence_score < self.PRESENCE_THRESHOLD:
+                logger.info(
+                    "Quantitative catalyst not detected (presence score below threshold)",
+                    presence_score=round(presence_score, 3),
+                    threshold=self.PRESENCE_THRESHOLD,
+                )
+                results[index] = self._negative_result(headline)
+            else:
+                candidates.append((index, presence_score))
+
+        # Step 2: Classify catalyst type (one batched call per type)
+        logger.debug("Classifying catalyst type", batch_size=len(candidates))
+        type_results = self._classify_type_batch(
+            [headlines[index] for index, _ in candidates]
+        )
+
+        for (index, presence_score), type_result in zip(candidates, type_results):
+            results[index] = self._build_result(
+                headlines[index], presence_score, type_result
             )
 
-        # Step 2: Extract values using regex
+        duration = time.time() - start_time
+        logger.debug(
+            "Quantitative catalyst batch completed",
+            batch_size=len(headlines),
+            duration_ms=round(duration * 1000, 2),
+        )
+
+        return results
+
+    def _negative_result(self, headline: str) -> QuantitativeCatalystResult:
+        """Build the negative result returned when no catalyst is present."""
+        return QuantitativeCatalystResult(
+            headline=headline,
+            has_quantitative_catalyst=False,
+            catalyst_type=None,
+            catalyst_values=[],
+            confidence=0.0,
+        )
+
+    def _build_result(
+        self, headline: str, presence_score: float, type_result: dict
+    ) -> QuantitativeCatalystResult:
+        """Combine presence score, extracted values and type into a final result.
+
+        Args:
+            headline: Headline text that passed the presence threshold
+            presence_score: MNLI presence score for the headline
+            type_result: Output of type classification for the headline
+
+        Returns:
+            QuantitativeCatalystResult with detection details
+        """
+        # Step 3: Extract values using regex
         logger.debug("Extracting quantitative values")
         catalyst_values = self._extract_values(headline)
         logger.debug(
@@ -167,9 +245,6 @@ class QuantitativeCatalystDetectorMNLS:
             values=catalyst_values,
         )
 
-        # Step 3: Classify catalyst type (Phase 2)
-        logger.debug("Classifying catalyst type")
-        type_result = self._classify_type(headline)
         catalyst_type = type_result["type"]
         type_score = type_result["confidence"]
         logger.debug(
@@ -199,14 +274,12 @@ class QuantitativeCatalystDetectorMNLS:
                 presence_score=round(presence_score, 3),
             )
 
-        duration = time.time() - start_time
         logger.info(
             "Quantitative catalyst detection completed",
             has_catalyst=has_catalyst,
             catalyst_type=catalyst_type,
             value_count=len(catalyst_values),
             confidence=round(confidence, 3),
-            duration_ms=round(duration * 1000, 2),
         )
 
         return QuantitativeCatalystResult(
@@ -217,25 +290,34 @@ class QuantitativeCatalystDetectorMNLS:
             confidence=confidence,
         )
 
-    def _check_presence(self, headline: str) -> float:
-        """Check if headline announces a quantitative catalyst using MNLI.
+    def _positive_label_scores(
+        self, headlines: list[str], labels: list[str]
+    ) -> list[float]:
+        """Score the first (positive) label for each headline in one pipeline call.
+
+        Scores are cached per (headline, positive label), so repeated headlines
+        skip the forward pass.
 
         Args:
-            headline: Headline text to check
+            headlines: Headline texts to classify
+            labels: Candidate labels, positive label first
 
         Returns:
-            Float score (0.0-1.0) indicating confidence that headline
-            announces a quantitative catalyst
+            Positive-label score (0.0-1.0) for each headline, in input order
         """
-        result = self._pipeline(headline, self.PRESENCE_LABELS)
+        return self._score_cache.score(self._pipeline, headlines, labels, labels[0])
 
-        # Extract score for "announces catalyst" label (first label)
-        if result["labels"][0] == self.PRESENCE_LABELS[0]:
-            # Top prediction is "catalyst" - use its score
-            return result["scores"][0]
-        else:
-            # Top prediction is "vague update" - return catalyst score (second)
-            return result["scores"][1]
+    def _check_presence_batch(self, headlines: list[str]) -> list[float]:
+        """Check if headlines announce a quantitative catalyst using MNLI.
+
+        Args:
+            headlines: Headline texts to check
+
+        Returns:
+            Float score (0.0-1.0) per headline indicating confidence that it
+            announces a quantitative catalyst
+        """
+        return self._positive_label_scores(headlines, self.PRESENCE_LABELS)
 
     def _extract_values(self, headline: str) -> list[str]:
         """Extract quantitative values from headline using regex.
@@ -254,79 +336,78 @@ class QuantitativeCatalystDetectorMNLS:
         values = []
 
         # Extract dollar amounts (including per-share prices)
-        for match in self.DOLLAR_PATTERN.finditer(headline):
-            amount = match.group(1)
-            unit = match.group(2) or ""  # B, M, K or empty
-
-            # Get the full matched text to preserve formatting
-            full_match = match.group(0)
-
-            # Standardize the format
-            if unit:
-                values.append(f"${amount}{unit}")
-            elif "/share" in full_match.lower() or "per share" in full_match.lower():
-                # Preserve per-share notation
-                if "/share" in full_match.lower():
-                    values.append(f"${amount}/Share")
+        # Plain substring checks skip the regex scans for headlines without "$" or "%"
+        if "$" in headline:
+            for match in self.DOLLAR_PATTERN.finditer(headline):
+                amount = match.group(1)
+                unit = match.group(2) or ""  # B, M, K or empty
+
+                # Get the full matched text to preserve formatting
+                full_match = match.group(0)
+
+                # Standardize the format
+                if unit:
+                    values.append(f"${amount}{unit}")
+                elif "/share" in full_match.lower() or "per share" in full_match.lower():
+                    # Preserve per-share notation
+                    if "/share" in full_match.lower():
+                        values.append(f"${amount}/Share")
+                    else:
+                        values.append(f"${amount}/Share")
                 else:
-                    values.append(f"${amount}/Share")
-            else:
-                # Check if "per share" appears within 5 words after the dollar amount
-                # This handles "Tender Offer At $10 Per Share" where regex doesn't capture it
-                match_end = match.end()
-                remaining = headline[match_end:match_end+30]  # Look ahead up to 30 chars
-                if re.search(r'\s+per\s+share', remaining, re.IGNORECASE):
-                    values.append(f"${amount}/Share")
-                else:
-                    values.append(f"${amount}")
+                    # Check if "per share" appears within 5 words after the dollar amount
+                    # This handles "Tender Offer At $10 Per Share" where regex doesn't capture it
+                    match_end = match.end()
+                    remaining = headline[match_end:match_end+30]  # Look ahead up to 30 chars
+                    if self.PER_SHARE_PATTERN.search(remaining):
+                        values.append(f"${amount}/Share")
+                    else:
+                        values.append(f"${amount}")
 
         # Extract percentages only if near financial keywords
-        if self.FINANCIAL_KEYWORDS.search(headline):
+        if "%" in headline and self.FINANCIAL_KEYWORDS.search(headline):
             for match in self.PERCENTAGE_PATTERN.finditer(headline):
                 pct_value = match.group(1)
                 values.append(f"{pct_value}%")
 
         return values
 
-    def _classify_type(self, headline: str) -> dict:
+    def _classify_type_batch(self, headlines: list[str]) -> list[dict]:
         """Classify catalyst type using MNLI.
 
-        Tests headline against all 5 catalyst type labels and returns
-        the highest-scoring type. Returns "mixed" if best score < threshold.
+        Tests each headline against all 5 catalyst type labels (one batched
+        pipeline call per type) and returns the highest-scoring type.
+        Returns "mixed" if best score < threshold.
 
         Args:
-            headline: Headline text to classify
+            headlines: Headline texts to classify
 
         Returns:
-            Dict with:
+            List of dicts (one per headline) with:
                 - type: str (dividend/acquisition/buyback/earnings/guidance/mixed)
                 - confidence: float (0.0-1.0, score of best type)
         """
-        type_scores = {}
+        type_scores = [{} for _ in headlines]
 
         # Test each catalyst type
         for catalyst_type, labels in self.CATALYST_TYPE_LABELS.items():
-            result = self._pipeline(headline, labels)
-
-            # Extract score for positive label (first label)
-            if result["labels"][0] == labels[0]:
-                # Top prediction is this type - use its score
-                score = result["scores"][0]
+            scores = self._positive_label_scores(headlines, labels)
+            for headline_scores, score in zip(type_scores, scores):
+                headline_scores[catalyst_type] = score
+
+        results = []
+        for headline_scores in type_scores:
+            # Find highest-scoring type
+            best_type = max(headline_scores, key=headline_scores.get)
+            best_score = headline_scores[best_type]
+
+            # If best score below threshold, return "mixed" (ambiguous)
+            if best_score < self.TYPE_THRESHOLD:
+                results.append({"type": "mixed", "confidence": best_score})
             else:
-                # Top prediction is negative - use type score (second)
-                score = result["scores"][1]
-
-            type_scores[catalyst_type] = score
-
-        # Find highest-scoring type
-        best_type = max(type_scores, key=type_scores.get)
-        best_score = type_scores[best_type]
-
-        # If best score below threshold, return "mixed" (ambiguous)
-        if best_score < self.TYPE_THRESHOLD:
-            return {"type": "mixed", "confidence": best_score}
+                results.append({"type": best_type, "confidence": best_score})
 
-        return {"type": best_type, "confidence": best_score}
+        return results
 
     def _calculate_confidence(
         self,
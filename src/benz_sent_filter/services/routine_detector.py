@@ -6,26 +6,30 @@ materiality assessment for financial context.
 """
 
 import re
-from dataclasses import dataclass
-from typing import NamedTuple, Optional
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from typing import Any, ClassVar, NamedTuple, Optional
 
-from pydantic import BaseModel
 from transformers import pipeline
 
+from benz_sent_filter.services.company_context import COMPANY_CONTEXT, CompanyContext
 
-@dataclass
-class CompanyContext:
-    """Company financial context for materiality assessment.
+# Pattern categories reported in RoutineDetectionResult.detected_patterns,
+# in bit order (process_language is bit 0)
+PATTERN_CATEGORIES = ("process_language", "routine_transaction", "frequency_indicator")
 
-    Attributes:
-        market_cap: Market capitalization in USD
-        annual_revenue: Annual revenue in USD
-        total_assets: Total assets in USD
-    """
-
-    market_cap: float
-    annual_revenue: float
-    total_assets: float
+# One shared frozenset per combination of matched categories, indexed by the
+# bitmask of matched categories, so detect() never builds a pattern set
+_PATTERN_COMBOS = tuple(
+    frozenset(
+        category
+        for bit, category in enumerate(PATTERN_CATEGORIES)
+        if mask & (1 << bit)
+    )
+    for mask in range(1 << len(PATTERN_CATEGORIES))
+)
 
 
 class MaterialityRatio(NamedTuple):
@@ -40,31 +44,54 @@ class MaterialityRatio(NamedTuple):
     metric_type: str
 
 
-class RoutineDetectionResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RoutineDetectionResult:
     """Result model for routine operation detection.
 
     Phase 1 fields (required):
         routine_score: int (0-4) pattern match score
         confidence: float [0.0-1.0] confidence in routine detection
-        detected_patterns: list of matched pattern types
-        transaction_value: float or None (extracted dollar amount)
+        detected_patterns: frozenset of matched pattern types
+        transaction_value_cents: int or None (extracted amount in integer cents;
+            read it in dollars through the transaction_value property)
         process_stage: str ("early", "ongoing", "completed", "unknown")
         result: bool - final routine operation classification
 
     Phase 2 fields (optional, added later):
         materiality_score: int (-2 to 0) materiality assessment
         materiality_ratio: float or None (transaction / company metric)
+
+    A frozen slots dataclass rather than a pydantic model: results are built
+    on every detect() call and need no validation, and frozen instances can
+    be shared from the result cache.
     """
 
     routine_score: int
     confidence: float
-    detected_patterns: list[str]
-    transaction_value: Optional[float] = None
+    detected_patterns: frozenset[str]
+    transaction_value_cents: Optional[int] = None
     process_stage: str
     result: bool
     materiality_score: Optional[int] = None
     materiality_ratio: Optional[float] = None
 
+    @property
+    def transaction_value(self) -> Optional[float]:
+        """Extracted transaction amount in dollars, or None if not found."""
+        if self.transaction_value_cents is None:
+            return None
+        return self.transaction_value_cents / 100
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a JSON-serializable dict.
+
+        detected_patterns is emitted as a sorted list.
+        """
+        data = asdict(self)
+        data["detected_patterns"] = sorted(self.detected_patterns)
+        data["transaction_value"] = self.transaction_value
+        return data
+
 
 class RoutineOperationDetector:
     """Detector for routine business operations in financial services.
@@ -87,203 +114,187 @@ class RoutineOperationDetector:
     ROUTINE_THRESHOLD_REVENUE = 0.05  # 5% of revenue
     ROUTINE_THRESHOLD_ASSETS = 0.005  # 0.5% of assets (for financials)
 
+    # Score cut-offs applied to any materiality ratio (strictest threshold for
+    # "clearly immaterial"), derived once instead of per calculate_materiality_score
+    IMMATERIAL_SCORE_THRESHOLD = min(
+        IMMATERIAL_THRESHOLD_MARKET_CAP, ROUTINE_THRESHOLD_ASSETS
+    )
+    ROUTINE_SCORE_THRESHOLD = ROUTINE_THRESHOLD_REVENUE
+
+    # Result returned for None/empty headlines and headlines that match nothing
+    # (frozen, so safe to share)
+    EMPTY_RESULT = RoutineDetectionResult(
+        routine_score=0,
+        confidence=0.5,
+        detected_patterns=_PATTERN_COMBOS[0],
+        transaction_value_cents=None,
+        process_stage="unknown",
+        result=False,
+    )
+
+    # Shortest headline any pattern can match ("mbs", "$1m"); shorter headlines
+    # without a company symbol always produce EMPTY_RESULT
+    MIN_MATCHABLE_LENGTH = 3
+
+    # Maximum number of (headline, company_symbol) results kept in the LRU cache
+    RESULT_CACHE_SIZE = 1024
+
     # Company context dictionary (Phase 2)
-    COMPANY_CONTEXT = {
-        "FNMA": CompanyContext(
-            market_cap=4_000_000_000,
-            annual_revenue=25_000_000_000,
-            total_assets=4_000_000_000_000,
-        ),
-        "BAC": CompanyContext(
-            market_cap=300_000_000_000,
-            annual_revenue=100_000_000_000,
-            total_assets=3_000_000_000_000,
-        ),
-        "JPM": CompanyContext(
-            market_cap=450_000_000_000,
-            annual_revenue=150_000_000_000,
-            total_assets=3_800_000_000_000,
-        ),
-        "WFC": CompanyContext(
-            market_cap=180_000_000_000,
-            annual_revenue=85_000_000_000,
-            total_assets=1_900_000_000_000,
-        ),
-        "C": CompanyContext(
-            market_cap=100_000_000_000,
-            annual_revenue=75_000_000_000,
-            total_assets=2_400_000_000_000,
-        ),
-        "GS": CompanyContext(
-            market_cap=110_000_000_000,
-            annual_revenue=48_000_000_000,
-            total_assets=1_600_000_000_000,
-        ),
-        "MS": CompanyContext(
-            market_cap=150_000_000_000,
-            annual_revenue=54_000_000_000,
-            total_assets=1_200_000_000_000,
-        ),
-        "USB": CompanyContext(
-            market_cap=75_000_000_000,
-            annual_revenue=24_000_000_000,
-            total_assets=650_000_000_000,
-        ),
-        "PNC": CompanyContext(
-            market_cap=65_000_000_000,
-            annual_revenue=20_000_000_000,
-            total_assets=560_000_000_000,
-        ),
-        "TFC": CompanyContext(
-            market_cap=55_000_000_000,
-            annual_revenue=18_000_000_000,
-            total_assets=530_000_000_000,
-        ),
-        "BK": CompanyContext(
-            market_cap=45_000_000_000,
-            annual_revenue=16_000_000_000,
-            total_assets=430_000_000_000,
-        ),
-        "STT": CompanyContext(
-            market_cap=28_000_000_000,
-            annual_revenue=12_000_000_000,
-            total_assets=300_000_000_000,
-        ),
-        "COF": CompanyContext(
-            market_cap=55_000_000_000,
-            annual_revenue=32_000_000_000,
-            total_assets=470_000_000_000,
-        ),
-        "AXP": CompanyContext(
-            market_cap=150_000_000_000,
-            annual_revenue=52_000_000_000,
-            total_assets=240_000_000_000,
-        ),
-        "SCHW": CompanyContext(
-            market_cap=120_000_000_000,
-            annual_revenue=20_000_000_000,
-            total_assets=460_000_000_000,
-        ),
-        "BLK": CompanyContext(
-            market_cap=130_000_000_000,
-            annual_revenue=19_000_000_000,
-            total_assets=180_000_000_000,
-        ),
-        "FHLMC": CompanyContext(
-            market_cap=3_500_000_000,
-            annual_revenue=22_000_000_000,
-            total_assets=3_200_000_000_000,
-        ),
-        "AIG": CompanyContext(
-            market_cap=48_000_000_000,
-            annual_revenue=50_000_000_000,
-            total_assets=580_000_000_000,
-        ),
-        "PRU": CompanyContext(
-            market_cap=38_000_000_000,
-            annual_revenue=58_000_000_000,
-            total_assets=900_000_000_000,
-        ),
-        "MET": CompanyContext(
-            market_cap=50_000_000_000,
-            annual_revenue=68_000_000_000,
-            total_assets=750_000_000_000,
-        ),
-        "ALL": CompanyContext(
-            market_cap=40_000_000_000,
-            annual_revenue=52_000_000_000,
-            total_assets=130_000_000_000,
-        ),
-    }
+    COMPANY_CONTEXT: ClassVar[Mapping[str, CompanyContext]] = COMPANY_CONTEXT
 
     # Process language patterns (compiled regex)
-    PROCESS_LANGUAGE_PATTERNS = {
+    # All patterns below are lowercase and matched against lowercased text
+    PROCESS_LANGUAGE_PATTERNS: ClassVar[dict[str, re.Pattern]] = {
         "initiation": re.compile(
             r"\b(begins?|starts?|initiates?|commences?|launches?)\b",
-            re.IGNORECASE,
         ),
         "marketing": re.compile(
             r"\b(marketing|available for purchase|opens? bidding|seeks? bids?)\b",
-            re.IGNORECASE,
         ),
         "planning": re.compile(
             r"\b(files? to|plans? to|intends? to|expects? to)\b",
-            re.IGNORECASE,
         ),
         "evaluation": re.compile(
             r"\b(exploring options?|considering|evaluating|reviewing)\b",
-            re.IGNORECASE,
         ),
     }
 
     # Financial services transaction type patterns
-    FINANCIAL_SERVICES_PATTERNS = {
+    FINANCIAL_SERVICES_PATTERNS: ClassVar[dict[str, re.Pattern]] = {
         "loan_sales": re.compile(
             r"\b(sale of (?:re)?performing loans?|loan portfolio|mortgage-backed securities|mbs)\b",
-            re.IGNORECASE,
         ),
         "buyback": re.compile(
             r"\b(buyback|repurchase program|share repurchase)\b",
-            re.IGNORECASE,
         ),
         "dividend": re.compile(
             r"\b(dividend payment|dividend)\b",
-            re.IGNORECASE,
         ),
         "refinancing": re.compile(
             r"\b(refinancing|bond issuance|debt offering)\b",
-            re.IGNORECASE,
         ),
     }
 
     # Frequency indicator patterns
-    FREQUENCY_PATTERNS = {
+    FREQUENCY_PATTERNS: ClassVar[dict[str, re.Pattern]] = {
         "recurrence": re.compile(
             r"\b(most recent|latest|another|continues?)\b",
-            re.IGNORECASE,
         ),
         "schedule": re.compile(
             r"\b(quarterly|annual|regular|ongoing)\b",
-            re.IGNORECASE,
         ),
         "program": re.compile(
             r"\b(as part of|in line with|pursuant to)\b",
-            re.IGNORECASE,
         ),
     }
 
+    # All routine keyword patterns above fused into one alternation with a
+    # named group per sub-category ("process_initiation", "transaction_buyback",
+    # "frequency_schedule", ...). A single finditer pass yields every matched
+    # sub-category via match.lastgroup. Sub-category alternatives never overlap,
+    # so non-overlapping matching finds the same sub-categories as searching
+    # each pattern separately.
+    ROUTINE_KEYWORD_PATTERN = re.compile(
+        "|".join(
+            f"(?P<{prefix}_{name}>{pattern.pattern})"
+            for prefix, patterns in (
+                ("process", PROCESS_LANGUAGE_PATTERNS),
+                ("transaction", FINANCIAL_SERVICES_PATTERNS),
+                ("frequency", FREQUENCY_PATTERNS),
+            )
+            for name, pattern in patterns.items()
+        )
+    )
+
+    # Group names per category in ROUTINE_KEYWORD_PATTERN
+    _WEAK_PROCESS_GROUPS = frozenset(
+        {"process_marketing", "process_planning", "process_evaluation"}
+    )
+    _TRANSACTION_GROUPS = frozenset(
+        f"transaction_{name}" for name in FINANCIAL_SERVICES_PATTERNS
+    )
+    _FREQUENCY_GROUPS = frozenset(f"frequency_{name}" for name in FREQUENCY_PATTERNS)
+
+    # Dollar amount patterns
+    # Ranges: "between $50m and $100m" (midpoint is used)
+    RANGE_AMOUNT_PATTERN = re.compile(
+        r"between\s+[\$€](\d+(?:\.\d+)?)\s*([mb])\s+and\s+[\$€](\d+(?:\.\d+)?)\s*([mb])",
+    )
+
+    # Single amounts in one scan: abbreviation in group 2 ($560m, €100m),
+    # word form in group 3 ($500 million, $2.3 billion)
+    AMOUNT_PATTERN = re.compile(
+        r"[\$€](\d+(?:\.\d+)?)(?:\s*([mb])\b|\s+(million|billion)\b)",
+    )
+
+    AMOUNT_MULTIPLIERS = {
+        "m": 1_000_000,
+        "million": 1_000_000,
+        "b": 1_000_000_000,
+        "billion": 1_000_000_000,
+    }
+
     # Override patterns
     SUPERLATIVE_PATTERN = re.compile(
         r"\b(record|largest|unprecedented|historic|biggest|highest|never before)\b",
-        re.IGNORECASE,
     )
 
     COMPLETION_PATTERN = re.compile(
         r"\b(completes?|announces? completion|closes?)\b",
-        re.IGNORECASE,
     )
 
     SPECIAL_KEYWORD_PATTERN = re.compile(
         r"\bspecial\b",
-        re.IGNORECASE,
+    )
+
+    # Every explicit override in one scan, with a named group per kind
+    # ("superlative", "completion", "special") so one finditer pass serves both
+    # the confidence penalty and the final-decision override
+    OVERRIDE_PATTERN = re.compile(
+        "|".join(
+            f"(?P<{name}>{pattern.pattern})"
+            for name, pattern in (
+                ("superlative", SUPERLATIVE_PATTERN),
+                ("completion", COMPLETION_PATTERN),
+                ("special", SPECIAL_KEYWORD_PATTERN),
+            )
+        )
     )
 
     # Process stage detection patterns
     EARLY_STAGE_PATTERN = re.compile(
         r"\b(begins?|starts?|initiates?)\b",
-        re.IGNORECASE,
     )
 
     ONGOING_STAGE_PATTERN = re.compile(
         r"\b(continues?|ongoing)\b",
-        re.IGNORECASE,
     )
 
     COMPLETED_STAGE_PATTERN = re.compile(
         r"\b(completes?|announces? completion|closes?)\b",
-        re.IGNORECASE,
     )
 
+    # All stages in one scan, with a named group per stage. Stage keywords
+    # never overlap, so one finditer pass sees every stage in the headline.
+    PROCESS_STAGE_PATTERN = re.compile(
+        "|".join(
+            f"(?P<{stage}>{pattern.pattern})"
+            for stage, pattern in (
+                ("early", EARLY_STAGE_PATTERN),
+                ("ongoing", ONGOING_STAGE_PATTERN),
+                ("completed", COMPLETED_STAGE_PATTERN),
+            )
+        )
+    )
+
+    def __init__(self):
+        """Initialize the detector's result cache."""
+        # LRU cache of detection results keyed by (headline, company_symbol)
+        self._result_cache: OrderedDict[
+            tuple[str, Optional[str]], RoutineDetectionResult
+        ] = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+
     def detect(
         self, headline: Optional[str], company_symbol: Optional[str] = None
     ) -> RoutineDetectionResult:
@@ -296,43 +307,91 @@ class RoutineOperationDetector:
         Returns:
             RoutineDetectionResult with scores, patterns, and final classification
         """
-        # Handle None/empty input
+        # Handle None/empty input with the shared precomputed result
         if not headline:
-            return RoutineDetectionResult(
-                routine_score=0,
-                confidence=0.5,
-                detected_patterns=[],
-                transaction_value=None,
-                process_stage="unknown",
-                result=False,
-            )
+            return self.EMPTY_RESULT
 
-        # Initialize scoring
-        routine_score = 0
-        detected_patterns = []
+        # Too short to match any pattern; only a company symbol can still
+        # change the result (materiality fields, context confidence boost)
+        if len(headline) < self.MIN_MATCHABLE_LENGTH and company_symbol is None:
+            return self.EMPTY_RESULT
+
+        key = (headline, company_symbol)
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                return cached
+
+        result = self._detect_headline(headline, company_symbol)
+
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            # Evict oldest entries once the cache is over capacity
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
 
-        # Detect process language
-        process_score = self._detect_process_language(headline)
-        if process_score > 0:
-            routine_score += process_score
-            detected_patterns.append("process_language")
+        return result
 
-        # Detect routine transaction types
-        if self._detect_routine_transaction(headline):
-            routine_score += 1
-            detected_patterns.append("routine_transaction")
+    def _detect_headline(
+        self, headline: str, company_symbol: Optional[str]
+    ) -> RoutineDetectionResult:
+        """Run pattern detection and materiality assessment for one headline.
+
+        Args:
+            headline: Non-empty headline to analyze
+            company_symbol: Optional company ticker symbol for materiality assessment
 
-        # Detect frequency indicators
-        frequency_score = self._detect_frequency_indicators(headline)
-        if frequency_score > 0:
-            routine_score += frequency_score
-            detected_patterns.append("frequency_indicator")
+        Returns:
+            RoutineDetectionResult with scores, patterns, and final classification
+        """
+        # Lowercase once; all patterns are compiled lowercase without
+        # re.IGNORECASE so no per-character case folding happens in the scans
+        text = headline.lower()
 
-        # Extract transaction value
-        transaction_value = self._extract_dollar_amount(headline)
+        # Initialize scoring
+        routine_score = 0
+        pattern_mask = 0
+
+        # One pass over the headline finds every matched sub-category. The scan
+        # stops early once every category score is at its cap, so long or
+        # repetitive headlines do no work past that point.
+        matched_groups = set()
+        for match in self.ROUTINE_KEYWORD_PATTERN.finditer(text):
+            group = match.lastgroup
+            if group not in matched_groups:
+                matched_groups.add(group)
+                if self._category_scores_saturated(matched_groups):
+                    break
+
+        if matched_groups:
+            # Detect process language
+            process_score = self._detect_process_language(matched_groups)
+            if process_score > 0:
+                routine_score += process_score
+                pattern_mask |= 1
+
+            # Detect routine transaction types
+            if self._detect_routine_transaction(matched_groups):
+                routine_score += 1
+                pattern_mask |= 2
+
+            # Detect frequency indicators
+            frequency_score = self._detect_frequency_indicators(matched_groups)
+            if frequency_score > 0:
+                routine_score += frequency_score
+                pattern_mask |= 4
+
+        # Extract transaction value (exact integer cents; dollars for materiality)
+        transaction_value_cents = self._extract_amount_cents(text)
+        transaction_value = (
+            transaction_value_cents / 100
+            if transaction_value_cents is not None
+            else None
+        )
 
         # Detect process stage
-        process_stage = self._detect_process_stage(headline)
+        process_stage = self._detect_process_stage(text)
 
         # Phase 2: Materiality assessment
         materiality_score = 0
@@ -356,81 +415,127 @@ class RoutineOperationDetector:
                             materiality_ratio
                         )
 
+        # One scan finds whether any override is present and whether one of
+        # them is a superlative; it stops at the first superlative
+        has_override = has_superlative = False
+        for match in self.OVERRIDE_PATTERN.finditer(text):
+            has_override = True
+            if match.lastgroup == "superlative":
+                has_superlative = True
+                break
+
         # Calculate confidence (Phase 2: enhanced with materiality factors)
         confidence = self._calculate_confidence(
-            routine_score, headline, materiality_score, company_context_available
+            routine_score,
+            has_superlative,
+            materiality_score,
+            company_context_available,
         )
 
         # Final decision with explicit overrides (Phase 2: uses materiality_score)
         result = self._make_final_decision(
-            routine_score, headline, materiality_score
+            routine_score, has_override, materiality_score
         )
 
+        # Nothing matched and no company context: share the empty result
+        # instead of allocating an identical one
+        if (
+            not routine_score
+            and transaction_value_cents is None
+            and process_stage == "unknown"
+            and not company_symbol
+            and not has_superlative
+        ):
+            return self.EMPTY_RESULT
+
         return RoutineDetectionResult(
             routine_score=routine_score,
             confidence=confidence,
-            detected_patterns=detected_patterns,
-            transaction_value=transaction_value,
+            detected_patterns=_PATTERN_COMBOS[pattern_mask],
+            transaction_value_cents=transaction_value_cents,
             process_stage=process_stage,
             result=result,
             materiality_score=materiality_score if company_symbol else None,
             materiality_ratio=materiality_ratio,
         )
 
-    def _detect_process_language(self, text: str) -> int:
-        """Detect process language patterns.
+    def detect_many(
+        self, headlines: list[Optional[str]], company_symbol: Optional[str] = None
+    ) -> list[RoutineDetectionResult]:
+        """Detect routine business operations in multiple headlines.
+
+        Args:
+            headlines: News article headlines to analyze
+            company_symbol: Optional company ticker symbol applied to every headline
 
         Returns:
-            Score contribution (0-2)
+            List of RoutineDetectionResult in same order as input
         """
-        score = 0
+        detect = self.detect
+        return [detect(headline, company_symbol) for headline in headlines]
+
+    def _category_scores_saturated(self, matched_groups: set[str]) -> bool:
+        """Check whether further keyword matches could change any category score.
 
-        # Check initiation patterns (strong indicator, +2)
-        if self.PROCESS_LANGUAGE_PATTERNS["initiation"].search(text):
-            score = max(score, 2)
+        Args:
+            matched_groups: ROUTINE_KEYWORD_PATTERN group names matched so far
 
-        # Check marketing patterns (+1)
-        if self.PROCESS_LANGUAGE_PATTERNS["marketing"].search(text):
-            score = max(score, 1)
+        Returns:
+            True if process language (+2), routine transaction (+1) and
+            frequency indicators (+2) are all at their maximum
+        """
+        return (
+            "process_initiation" in matched_groups
+            and not self._TRANSACTION_GROUPS.isdisjoint(matched_groups)
+            and len(self._FREQUENCY_GROUPS & matched_groups) >= 2
+        )
 
-        # Check planning patterns (+1)
-        if self.PROCESS_LANGUAGE_PATTERNS["planning"].search(text):
-            score = max(score, 1)
+    def _detect_process_language(self, matched_groups: set[str]) -> int:
+        """Detect process language patterns.
+
+        Args:
+            matched_groups: ROUTINE_KEYWORD_PATTERN group names matched in the headline
+
+        Returns:
+            Score contribution (0-2)
+        """
+        # Initiation patterns (strong indicator, +2)
+        if "process_initiation" in matched_groups:
+            return 2
 
-        # Check evaluation patterns (+1)
-        if self.PROCESS_LANGUAGE_PATTERNS["evaluation"].search(text):
-            score = max(score, 1)
+        # Marketing, planning or evaluation patterns (+1)
+        if not self._WEAK_PROCESS_GROUPS.isdisjoint(matched_groups):
+            return 1
 
-        return score
+        return 0
 
-    def _detect_routine_transaction(self, text: str) -> bool:
+    def _detect_routine_transaction(self, matched_groups: set[str]) -> bool:
         """Detect routine transaction type patterns.
 
+        Args:
+            matched_groups: ROUTINE_KEYWORD_PATTERN group names matched in the headline
+
         Returns:
             True if routine transaction type detected
         """
-        for pattern in self.FINANCIAL_SERVICES_PATTERNS.values():
-            if pattern.search(text):
-                return True
-        return False
+        return not self._TRANSACTION_GROUPS.isdisjoint(matched_groups)
 
-    def _detect_frequency_indicators(self, text: str) -> int:
+    def _detect_frequency_indicators(self, matched_groups: set[str]) -> int:
         """Detect frequency indicator patterns.
 
+        Args:
+            matched_groups: ROUTINE_KEYWORD_PATTERN group names matched in the headline
+
         Returns:
             Score contribution (0-2)
         """
-        matches = 0
-
-        for pattern in self.FREQUENCY_PATTERNS.values():
-            if pattern.search(text):
-                matches += 1
+        matches = len(self._FREQUENCY_GROUPS & matched_groups)
 
         # Multiple indicators compound the score
         return min(matches, 2)
 
-    def _extract_dollar_amount(self, text: str) -> Optional[float]:
-        """Extract dollar amount from text.
+    def _extract_amount_cents(self, text: str) -> Optional[int]:
+        """Extract dollar amount from text as integer cents.
 
         Supports formats:
         - $560M, $1.5B
@@ -438,70 +543,74 @@ class RoutineOperationDetector:
         - €100M (euro symbol)
         - "Between $50M and $100M" (returns midpoint)
 
+        Amounts are scaled with integer arithmetic, so "$1.1M" is exactly
+        110_000_000 cents rather than the float 1.1 * 1e6.
+
         Returns:
-            Amount in dollars or None if not found
+            Amount in cents or None if not found
         """
-        # Pattern for ranges: "between $X and $Y"
-        range_pattern = re.compile(
-            r"between\s+[\$€](\d+(?:\.\d+)?)\s*([MB])\s+and\s+[\$€](\d+(?:\.\d+)?)\s*([MB])",
-            re.IGNORECASE,
-        )
-        range_match = range_pattern.search(text)
-        if range_match:
-            val1 = float(range_match.group(1))
-            unit1 = range_match.group(2).upper()
-            val2 = float(range_match.group(3))
-            unit2 = range_match.group(4).upper()
-
-            mult1 = 1_000_000 if unit1 == "M" else 1_000_000_000
-            mult2 = 1_000_000 if unit2 == "M" else 1_000_000_000
-
-            return (val1 * mult1 + val2 * mult2) / 2
-
-        # Pattern for single amounts with abbreviation: $560M, $1.5B, €100M
-        abbr_pattern = re.compile(
-            r"[\$€](\d+(?:\.\d+)?)\s*([MB])\b",
-            re.IGNORECASE,
-        )
-        abbr_match = abbr_pattern.search(text)
-        if abbr_match:
-            value = float(abbr_match.group(1))
-            unit = abbr_match.group(2).upper()
-            multiplier = 1_000_000 if unit == "M" else 1_000_000_000
-            return value * multiplier
-
-        # Pattern for amounts with words: $500 million, $2.3 billion
-        word_pattern = re.compile(
-            r"[\$€](\d+(?:\.\d+)?)\s+(million|billion)\b",
-            re.IGNORECASE,
-        )
-        word_match = word_pattern.search(text)
-        if word_match:
-            value = float(word_match.group(1))
-            unit = word_match.group(2).lower()
-            multiplier = 1_000_000 if unit == "million" else 1_000_000_000
-            return value * multiplier
+        # Ranges: "between $X and $Y"
+        if "between" in text:
+            range_match = self.RANGE_AMOUNT_PATTERN.search(text)
+            if range_match:
+                low = self._amount_to_cents(range_match.group(1), range_match.group(2))
+                high = self._amount_to_cents(range_match.group(3), range_match.group(4))
+                return (low + high) // 2
+
+        # Single amounts: the first abbreviated amount wins over word forms,
+        # otherwise the first word-form amount is used
+        word_amount = None
+        for match in self.AMOUNT_PATTERN.finditer(text):
+            if match.group(2):
+                return self._amount_to_cents(match.group(1), match.group(2))
+            if word_amount is None:
+                word_amount = self._amount_to_cents(match.group(1), match.group(3))
+
+        return word_amount
+
+    def _amount_to_cents(self, amount: str, unit: str) -> int:
+        """Scale a decimal amount string by its unit into integer cents.
 
-        return None
+        Args:
+            amount: Decimal digits as matched, e.g. "560.5"
+            unit: Lowercased unit key of AMOUNT_MULTIPLIERS ("m", "billion", ...)
+
+        Returns:
+            Amount in cents (sub-cent digits are truncated)
+        """
+        cents_per_unit = self.AMOUNT_MULTIPLIERS[unit] * 100
+        whole, _, fraction = amount.partition(".")
+        cents = int(whole) * cents_per_unit
+        if fraction:
+            cents += int(fraction) * cents_per_unit // 10 ** len(fraction)
+        return cents
 
     def _detect_process_stage(self, text: str) -> str:
         """Detect process stage from keywords.
 
+        Stages take priority early > ongoing > completed regardless of where
+        their keywords appear in the headline.
+
         Returns:
             "early", "ongoing", "completed", or "unknown"
         """
-        if self.EARLY_STAGE_PATTERN.search(text):
-            return "early"
-        if self.ONGOING_STAGE_PATTERN.search(text):
+        stages = set()
+        for match in self.PROCESS_STAGE_PATTERN.finditer(text):
+            # Highest-priority stage; nothing later can change the result
+            if match.lastgroup == "early":
+                return "early"
+            stages.add(match.lastgroup)
+
+        if "ongoing" in stages:
             return "ongoing"
-        if self.COMPLETED_STAGE_PATTERN.search(text):
+        if "completed" in stages:
             return "completed"
         return "unknown"
 
     def _calculate_confidence(
         self,
         routine_score: int,
-        headline: str,
+        has_superlative: bool,
         materiality_score: int = 0,
         company_context_available: bool = False,
     ) -> float:
@@ -517,31 +626,30 @@ class RoutineOperationDetector:
         Factors that decrease confidence:
         - Conflicting signals (superlatives + routine patterns): -0.3
 
+        Args:
+            routine_score: Aggregated pattern match score
+            has_superlative: Whether the headline contains a superlative
+            materiality_score: Materiality assessment score (Phase 2)
+            company_context_available: Whether company context was found (Phase 2)
+
         Returns:
             Confidence clamped to [0.0, 1.0]
         """
-        confidence = 0.5
-
-        # Strong pattern boost
-        if routine_score >= 3:
-            confidence += 0.2
-
-        # Phase 2: Materiality boosts
-        if materiality_score <= -2:
-            confidence += 0.2
-
-        if company_context_available:
-            confidence += 0.15
-
-        # Conflicting signals penalty
-        if self.SUPERLATIVE_PATTERN.search(headline):
-            confidence -= 0.3
+        # One expression over boolean factors (True/False weight 1/0); the
+        # terms are added in the same order as the factors listed above
+        confidence = (
+            0.5
+            + 0.2 * (routine_score >= 3)  # Strong pattern boost
+            + 0.2 * (materiality_score <= -2)  # Phase 2: Materiality boost
+            + 0.15 * company_context_available  # Phase 2: Context boost
+            - 0.3 * has_superlative  # Conflicting signals penalty
+        )
 
         # Clamp to valid range
         return max(0.0, min(1.0, confidence))
 
     def _make_final_decision(
-        self, routine_score: int, headline: str, materiality_score: int = 0
+        self, routine_score: int, has_override: bool, materiality_score: int = 0
     ) -> bool:
         """Make final routine operation classification decision.
 
@@ -555,20 +663,15 @@ class RoutineOperationDetector:
 
         Args:
             routine_score: Aggregated pattern match score
-            headline: Headline text for override checks
+            has_override: Whether the headline contains a superlative,
+                completion or special keyword
             materiality_score: Materiality assessment score (Phase 2)
 
         Returns:
             True if routine operation, False otherwise
         """
         # Check explicit overrides first
-        if self.SUPERLATIVE_PATTERN.search(headline):
-            return False
-
-        if self.COMPLETION_PATTERN.search(headline):
-            return False
-
-        if self.SPECIAL_KEYWORD_PATTERN.search(headline):
+        if has_override:
             return False
 
         # Base threshold rule (Phase 2: includes materiality)
@@ -663,16 +766,9 @@ class RoutineOperationDetector:
         if ratio is None:
             return 0
 
-        # Check against thresholds (use strictest threshold)
-        immaterial_threshold = min(
-            self.IMMATERIAL_THRESHOLD_MARKET_CAP,
-            self.ROUTINE_THRESHOLD_ASSETS,
+        # Each threshold the ratio falls below costs one point; the cut-offs are
+        # nested, so this yields -2/-1/0 without an elif chain (NaN scores 0)
+        return -(
+            (ratio < self.IMMATERIAL_SCORE_THRESHOLD)
+            + (ratio < self.ROUTINE_SCORE_THRESHOLD)
         )
-        routine_threshold = self.ROUTINE_THRESHOLD_REVENUE
-
-        if ratio < immaterial_threshold:
-            return -2  # Clearly immaterial
-        elif ratio < routine_threshold:
-            return -1  # Borderline
-        else:
-            return 0  # Material
@@ -7,27 +7,18 @@ combined with materiality assessment.
 
 import re
 import time
-from dataclasses import dataclass
-from typing import Optional
+from collections.abc import Mapping
+from typing import ClassVar, Optional
 
 from loguru import logger
 from pydantic import BaseModel
-from transformers import pipeline
 
-
-@dataclass
-class CompanyContext:
-    """Company financial context for materiality assessment.
-
-    Attributes:
-        market_cap: Market capitalization in USD
-        annual_revenue: Annual revenue in USD
-        total_assets: Total assets in USD
-    """
-
-    market_cap: float
-    annual_revenue: float
-    total_assets: float
+from benz_sent_filter.config.settings import ONNX_QUANTIZE_INT8
+from benz_sent_filter.services.company_context import COMPANY_CONTEXT, CompanyContext
+from benz_sent_filter.services.zero_shot_pipeline import (
+    ZeroShotScoreCache,
+    create_zero_shot_pipeline,
+)
 
 
 class RoutineDetectionResult(BaseModel):
@@ -36,7 +27,8 @@ class RoutineDetectionResult(BaseModel):
     Fields:
         routine_score: MNLS confidence score (renamed for compatibility)
         confidence: Same as routine_score (for API compatibility)
-        detected_patterns: Always ["mnls_classification"]
+        detected_patterns: ["mnls_classification"], or ["hard_materiality_floor"]
+            when a large transaction was judged material without running MNLS
         transaction_value: Extracted dollar amount or None
         process_stage: Detected from keywords
         result: Final routine operation classification
@@ -69,6 +61,20 @@ class RoutineOperationDetectorMNLS:
     ROUTINE_THRESHOLD_REVENUE = 0.05  # 5% of revenue
     ROUTINE_THRESHOLD_ASSETS = 0.005  # 0.5% of assets (for financials)
 
+    # Score cut-offs applied to any materiality ratio (strictest threshold for
+    # "clearly immaterial"), same as the pattern-based detector
+    IMMATERIAL_SCORE_THRESHOLD = min(
+        IMMATERIAL_THRESHOLD_MARKET_CAP, ROUTINE_THRESHOLD_ASSETS
+    )
+    ROUTINE_SCORE_THRESHOLD = ROUTINE_THRESHOLD_REVENUE
+
+    # Transactions at or above this size are material when there is no company
+    # context to judge them against; such headlines skip MNLS entirely
+    HARD_MATERIALITY_FLOOR = 100_000_000  # $100M
+
+    # Maximum number of headline routine scores kept in the LRU cache
+    SCORE_CACHE_SIZE = 1024
+
     # MNLS candidate labels (materiality from investor perspective)
     # Tuned to distinguish between material events and routine business operations
     # Material: ONE-TIME transformational corporate events (strategic deals, partnerships, major milestones)
@@ -80,113 +86,7 @@ class RoutineOperationDetectorMNLS:
     ]
 
     # Company context dictionary (same as pattern-based version)
-    COMPANY_CONTEXT = {
-        "FNMA": CompanyContext(
-            market_cap=4_000_000_000,
-            annual_revenue=25_000_000_000,
-            total_assets=4_000_000_000_000,
-        ),
-        "BAC": CompanyContext(
-            market_cap=300_000_000_000,
-            annual_revenue=100_000_000_000,
-            total_assets=3_000_000_000_000,
-        ),
-        "JPM": CompanyContext(
-            market_cap=450_000_000_000,
-            annual_revenue=150_000_000_000,
-            total_assets=3_800_000_000_000,
-        ),
-        "WFC": CompanyContext(
-            market_cap=180_000_000_000,
-            annual_revenue=85_000_000_000,
-            total_assets=1_900_000_000_000,
-        ),
-        "C": CompanyContext(
-            market_cap=100_000_000_000,
-            annual_revenue=75_000_000_000,
-            total_assets=2_400_000_000_000,
-        ),
-        "GS": CompanyContext(
-            market_cap=110_000_000_000,
-            annual_revenue=48_000_000_000,
-            total_assets=1_600_000_000_000,
-        ),
-        "MS": CompanyContext(
-            market_cap=150_000_000_000,
-            annual_revenue=54_000_000_000,
-            total_assets=1_200_000_000_000,
-        ),
-        "USB": CompanyContext(
-            market_cap=75_000_000_000,
-            annual_revenue=24_000_000_000,
-            total_assets=650_000_000_000,
-        ),
-        "PNC": CompanyContext(
-            market_cap=65_000_000_000,
-            annual_revenue=20_000_000_000,
-            total_assets=560_000_000_000,
-        ),
-        "TFC": CompanyContext(
-            market_cap=55_000_000_000,
-            annual_revenue=18_000_000_000,
-            total_assets=530_000_000_000,
-        ),
-        "BK": CompanyContext(
-            market_cap=45_000_000_000,
-            annual_revenue=16_000_000_000,
-            total_assets=430_000_000_000,
-        ),
-        "STT": CompanyContext(
-            market_cap=28_000_000_000,
-            annual_revenue=12_000_000_000,
-            total_assets=300_000_000_000,
-        ),
-        "COF": CompanyContext(
-            market_cap=55_000_000_000,
-            annual_revenue=32_000_000_000,
-            total_assets=470_000_000_000,
-        ),
-        "AXP": CompanyContext(
-            market_cap=150_000_000_000,
-            annual_revenue=52_000_000_000,
-            total_assets=240_000_000_000,
-        ),
-        "SCHW": CompanyContext(
-            market_cap=120_000_000_000,
-            annual_revenue=20_000_000_000,
-            total_assets=460_000_000_000,
-        ),
-        "BLK": CompanyContext(
-            market_cap=130_000_000_000,
-            annual_revenue=19_000_000_000,
-            total_assets=180_000_000_000,
-        ),
-        "FHLMC": CompanyContext(
-            market_cap=3_500_000_000,
-            annual_revenue=22_000_000_000,
-            total_assets=3_200_000_000_000,
-        ),
-        "AIG": CompanyContext(
-            market_cap=48_000_000_000,
-            annual_revenue=50_000_000_000,
-            total_assets=580_000_000_000,
-        ),
-        "PRU": CompanyContext(
-            market_cap=38_000_000_000,
-            annual_revenue=58_000_000_000,
-            total_assets=900_000_000_000,
-        ),
-        "MET": CompanyContext(
-            market_cap=50_000_000_000,
-            annual_revenue=68_000_000_000,
-            total_assets=750_000_000_000,
-        ),
-        "ALL": CompanyContext(
-            market_cap=40_000_000_000,
-            annual_revenue=52_000_000_000,
-            total_assets=130_000_000_000,
-        ),
-    }
+    COMPANY_CONTEXT: ClassVar[Mapping[str, CompanyContext]] = COMPANY_CONTEXT
 
     # Process stage patterns (keep for metadata)
     EARLY_STAGE_PATTERN = re.compile(
@@ -202,13 +102,39 @@ class RoutineOperationDetectorMNLS:
         re.IGNORECASE,
     )
 
-    def __init__(self, model_name: str = "MoritzLaurer/deberta-v3-large-zeroshot-v2.0"):
+    # Dollar amount patterns (compiled once, used by _extract_dollar_amount)
+    RANGE_AMOUNT_PATTERN = re.compile(
+        r"between\s+[\$€](\d+(?:\.\d+)?)\s*([MB])\s+and\s+[\$€](\d+(?:\.\d+)?)\s*([MB])",
+        re.IGNORECASE,
+    )
+    ABBREVIATED_AMOUNT_PATTERN = re.compile(
+        r"[\$€](\d+(?:\.\d+)?)\s*([MB])\b",
+        re.IGNORECASE,
+    )
+    WORD_AMOUNT_PATTERN = re.compile(
+        r"[\$€](\d+(?:\.\d+)?)\s+(million|billion)\b",
+        re.IGNORECASE,
+    )
+
+    def __init__(
+        self,
+        model_name: str = "MoritzLaurer/deberta-v3-large-zeroshot-v2.0",
+        quantize: bool = ONNX_QUANTIZE_INT8,
+    ):
         """Initialize the MNLS-based routine operation detector.
 
         Args:
             model_name: HuggingFace model name for zero-shot classification
+            quantize: Use an int8-quantized ONNX Runtime model when the onnx
+                extra is installed (defaults to the ONNX_QUANTIZE_INT8 setting)
         """
-        self._pipeline = pipeline("zero-shot-classification", model=model_name)
+        # ONNX Runtime when available, else PyTorch
+        self._pipeline = create_zero_shot_pipeline(model_name, quantize=quantize)
+
+        # LRU cache of MNLS routine scores keyed by headline. Only the model
+        # score is cached; materiality depends on the company symbol and is
+        # cheap to recompute.
+        self._score_cache = ZeroShotScoreCache(self.SCORE_CACHE_SIZE)
 
     def detect(
         self, headline: Optional[str], company_symbol: Optional[str] = None
@@ -232,30 +158,175 @@ class RoutineOperationDetectorMNLS:
         # Handle None/empty input
         if not headline:
             logger.warning("Empty headline provided for routine detection")
-            return RoutineDetectionResult(
-                routine_score=0.5,
-                confidence=0.5,
-                detected_patterns=[],
-                transaction_value=None,
-                process_stage="unknown",
-                result=False,
+            return self._empty_result()
+
+        # Large transactions without company context are material; skip MNLS
+        floor_result = self._hard_floor_result(headline, company_symbol)
+        if floor_result is not None:
+            logger.info(
+                "Routine operation detection short-circuited (hard materiality floor)",
+                transaction_value=floor_result.transaction_value,
+                company_symbol=company_symbol,
             )
+            return floor_result
 
         # Use MNLS to classify routine vs material
-        mnls_result = self._pipeline(headline, self.ROUTINE_LABELS)
+        routine_score = self._routine_scores([headline])[0]
+
+        result = self._build_result(headline, company_symbol, routine_score)
+
+        duration = time.time() - start_time
+        logger.info(
+            "Routine operation detection completed",
+            is_routine=result.result,
+            routine_score=round(result.routine_score, 3),
+            has_transaction_value=result.transaction_value is not None,
+            transaction_value=result.transaction_value,
+            process_stage=result.process_stage,
+            materiality_score=result.materiality_score,
+            company_symbol=company_symbol,
+            duration_ms=round(duration * 1000, 2),
+        )
+
+        return result
+
+    def detect_batch(
+        self,
+        headlines: list[Optional[str]],
+        company_symbols: Optional[list[Optional[str]]] = None,
+    ) -> list[RoutineDetectionResult]:
+        """Detect routine business operations in multiple headlines.
+
+        Classifies every non-empty headline in a single batched pipeline call
+        instead of one forward pass per headline.
+
+        Args:
+            headlines: News article headlines to analyze
+            company_symbols: Optional company ticker symbol per headline for
+                materiality assessment (same length as headlines)
 
-        # Extract routine score (confidence that it's routine)
-        # mnls_result['labels'][0] is the top prediction
-        # mnls_result['scores'][0] is the confidence for top prediction
+        Returns:
+            List of RoutineDetectionResult in same order as input
+        """
+        if company_symbols is None:
+            company_symbols = [None] * len(headlines)
+
+        logger.debug(
+            "Starting routine operation batch detection", batch_size=len(headlines)
+        )
+        start_time = time.time()
+
+        results: list[Optional[RoutineDetectionResult]] = [None] * len(headlines)
+
+        # Handle None/empty input and large transactions without company context
+        pending = []
+        for index, headline in enumerate(headlines):
+            if not headline:
+                logger.warning("Empty headline provided for routine detection")
+                results[index] = self._empty_result()
+                continue
+
+            floor_result = self._hard_floor_result(headline, company_symbols[index])
+            if floor_result is not None:
+                results[index] = floor_result
+            else:
+                pending.append(index)
+
+        # Use MNLS to classify routine vs material (one batched call)
+        routine_scores = self._routine_scores([headlines[index] for index in pending])
+
+        for index, routine_score in zip(pending, routine_scores):
+            results[index] = self._build_result(
+                headlines[index], company_symbols[index], routine_score
+            )
+
+        duration = time.time() - start_time
+        logger.info(
+            "Routine operation batch detection completed",
+            batch_size=len(headlines),
+            routine_count=sum(result.result for result in results),
+            duration_ms=round(duration * 1000, 2),
+        )
+
+        return results
+
+    def _empty_result(self) -> RoutineDetectionResult:
+        """Build the neutral result returned for None/empty headlines."""
+        return RoutineDetectionResult(
+            routine_score=0.5,
+            confidence=0.5,
+            detected_patterns=[],
+            transaction_value=None,
+            process_stage="unknown",
+            result=False,
+        )
+
+    def _hard_floor_result(
+        self, headline: str, company_symbol: Optional[str]
+    ) -> Optional[RoutineDetectionResult]:
+        """Classify a large transaction as material without running MNLS.
+
+        Applies only when the symbol has no company context; with context,
+        materiality is judged relative to company size instead (e.g. a $560M
+        loan sale is routine for FNMA).
+
+        Args:
+            headline: Non-empty headline to check
+            company_symbol: Optional company ticker symbol
+
+        Returns:
+            Material RoutineDetectionResult if the extracted transaction value
+            is at or above HARD_MATERIALITY_FLOOR, None otherwise
+        """
+        if company_symbol in self.COMPANY_CONTEXT:
+            return None
+
+        transaction_value = self._extract_dollar_amount(headline)
+        if transaction_value is None or transaction_value < self.HARD_MATERIALITY_FLOOR:
+            return None
+
+        return RoutineDetectionResult(
+            routine_score=0.0,
+            confidence=0.0,
+            detected_patterns=["hard_materiality_floor"],
+            transaction_value=transaction_value,
+            process_stage=self._detect_process_stage(headline),
+            result=False,
+            materiality_score=0 if company_symbol else None,
+            materiality_ratio=None,
+        )
+
+    def _routine_scores(self, headlines: list[str]) -> list[float]:
+        """Score each headline as routine in one pipeline call.
+
+        Scores are cached per headline, so repeated headlines skip the forward
+        pass.
+
+        Args:
+            headlines: Non-empty headline texts to classify
+
+        Returns:
+            Routine score (0.0-1.0) for each headline, in input order
+        """
         # ROUTINE_LABELS[0] = "significant strategic corporate event" (material)
         # ROUTINE_LABELS[1] = "routine recurring business activity" (routine)
-        if mnls_result["labels"][0] == self.ROUTINE_LABELS[1]:
-            # Top prediction is "routine" - use its score
-            routine_score = mnls_result["scores"][0]
-        else:
-            # Top prediction is "material" - use routine score (second score)
-            routine_score = mnls_result["scores"][1]
+        return self._score_cache.score(
+            self._pipeline, headlines, self.ROUTINE_LABELS, self.ROUTINE_LABELS[1]
+        )
+
+    def _build_result(
+        self, headline: str, company_symbol: Optional[str], routine_score: float
+    ) -> RoutineDetectionResult:
+        """Combine the MNLS routine score with materiality into a final result.
 
+        Args:
+            headline: Non-empty headline that was classified
+            company_symbol: Optional company ticker symbol for materiality assessment
+            routine_score: MNLS confidence that the headline is routine
+
+        Returns:
+            RoutineDetectionResult with MNLS scores and materiality assessment
+        """
         # Extract transaction value (keep helper from pattern matching)
         transaction_value = self._extract_dollar_amount(headline)
 
@@ -281,13 +352,12 @@ class RoutineOperationDetectorMNLS:
                     metric_type = "market_cap"
 
                 # Score materiality
+                # (-1 per threshold the ratio falls below: < 0.5% -> -2, < 5% -> -1)
                 if materiality_ratio is not None:
-                    if materiality_ratio < 0.005:  # < 0.5%
-                        materiality_score = -2
-                    elif materiality_ratio < 0.05:  # < 5%
-                        materiality_score = -1
-                    else:
-                        materiality_score = 0
+                    materiality_score = -(
+                        (materiality_ratio < self.IMMATERIAL_SCORE_THRESHOLD)
+                        + (materiality_ratio < self.ROUTINE_SCORE_THRESHOLD)
+                    )
 
         # Final decision: combine MNLS score with materiality
         # Priority order:
@@ -302,19 +372,6 @@ class RoutineOperationDetectorMNLS:
             # MNLI says routine
             result = True
 
-        duration = time.time() - start_time
-        logger.info(
-            "Routine operation detection completed",
-            is_routine=result,
-            routine_score=round(routine_score, 3),
-            has_transaction_value=transaction_value is not None,
-            transaction_value=transaction_value,
-            process_stage=process_stage,
-            materiality_score=materiality_score,
-            company_symbol=company_symbol,
-            duration_ms=round(duration * 1000, 2),
-        )
-
         return RoutineDetectionResult(
             routine_score=routine_score,
             confidence=routine_score,
@@ -339,11 +396,7 @@ class RoutineOperationDetectorMNLS:
             Amount in dollars or None if not found
         """
         # Pattern for ranges: "between $X and $Y"
-        range_pattern = re.compile(
-            r"between\s+[\$€](\d+(?:\.\d+)?)\s*([MB])\s+and\s+[\$€](\d+(?:\.\d+)?)\s*([MB])",
-            re.IGNORECASE,
-        )
-        range_match = range_pattern.search(text)
+        range_match = self.RANGE_AMOUNT_PATTERN.search(text)
         if range_match:
             val1 = float(range_match.group(1))
             unit1 = range_match.group(2).upper()
@@ -356,11 +409,7 @@ class RoutineOperationDetectorMNLS:
             return (val1 * mult1 + val2 * mult2) / 2
 
         # Pattern for single amounts with abbreviation: $560M, $1.5B, €100M
-        abbr_pattern = re.compile(
-            r"[\$€](\d+(?:\.\d+)?)\s*([MB])\b",
-            re.IGNORECASE,
-        )
-        abbr_match = abbr_pattern.search(text)
+        abbr_match = self.ABBREVIATED_AMOUNT_PATTERN.search(text)
         if abbr_match:
             value = float(abbr_match.group(1))
             unit = abbr_match.group(2).upper()
@@ -368,11 +417,7 @@ class RoutineOperationDetectorMNLS:
             return value * multiplier
 
         # Pattern for amounts with words: $500 million, $2.3 billion
-        word_pattern = re.compile(
-            r"[\$€](\d+(?:\.\d+)?)\s+(million|billion)\b",
-            re.IGNORECASE,
-        )
-        word_match = word_pattern.search(text)
+        word_match = self.WORD_AMOUNT_PATTERN.search(text)
         if word_match:
             value = float(word_match.group(1))
             unit = word_match.group(2).lower()
@@ -16,13 +16,18 @@ Quantitative Pre-Filter:
 """
 
 import re
+import threading
 import time
 from typing import Optional
 
 from loguru import logger
-from transformers import pipeline
 
+from benz_sent_filter.config.settings import ONNX_QUANTIZE_INT8
 from benz_sent_filter.models.classification import StrategicCatalystResult
+from benz_sent_filter.services.zero_shot_pipeline import (
+    ZeroShotScoreCache,
+    create_zero_shot_pipeline,
+)
 
 
 class StrategicCatalystDetectorMNLS:
@@ -41,11 +46,14 @@ class StrategicCatalystDetectorMNLS:
         r"\$(\d+(?:,\d{3})*(?:\.\d+)?)\s*([BMK])?\b(?:/[Ss]hare|\s+[Pp]er\s+[Ss]hare)?",
         re.IGNORECASE,
     )
-    PERCENTAGE_PATTERN = re.compile(r"\b(\d+(?:\.\d+)?)\s*%", re.IGNORECASE)
     FINANCIAL_KEYWORDS = re.compile(
         r"\b(dividend|yield|growth|return|margin|beat|miss|eps|earnings|revenue|guidance)\b",
         re.IGNORECASE,
     )
+    # Both rejection rules in one alternation, so the pre-filter is a single scan
+    QUANTITATIVE_PREFILTER = re.compile(
+        f"{DOLLAR_PATTERN.pattern}|{FINANCIAL_KEYWORDS.pattern}", re.IGNORECASE
+    )
 
     # MNLI candidate labels for presence detection
     # Optimized to distinguish strategic catalysts from financial results and routine operations
@@ -61,6 +69,9 @@ class StrategicCatalystDetectorMNLS:
     # Type classification threshold
     TYPE_THRESHOLD = 0.5  # Lowered to match presence detection threshold for better recall
 
+    # Maximum number of (headline, label) MNLI scores kept in the LRU cache
+    SCORE_CACHE_SIZE = 1024
+
     # MNLI labels for catalyst type classification
     # Tuned for semantic clarity with action-oriented verbs and distinctive features
     # Key principle: Avoid semantic overlap, use action verbs, include distinctive keywords
@@ -91,21 +102,44 @@ class StrategicCatalystDetectorMNLS:
         ],
     }
 
-    def __init__(self, model_name: str = "MoritzLaurer/deberta-v3-large-zeroshot-v2.0", pipeline=None):
+    def __init__(
+        self,
+        model_name: str = "MoritzLaurer/deberta-v3-large-zeroshot-v2.0",
+        pipeline=None,
+        quantize: bool = ONNX_QUANTIZE_INT8,
+    ):
         """Initialize the MNLI-based strategic catalyst detector.
 
+        Without a shared pipeline the model is loaded on the first headline
+        that reaches MNLI, so empty and pre-filtered headlines never load it.
+
         Args:
             model_name: HuggingFace model name for zero-shot classification
             pipeline: Optional pre-initialized transformers pipeline to share across services
+            quantize: When building its own pipeline, use an int8-quantized ONNX
+                Runtime model if the onnx extra is installed (defaults to the
+                ONNX_QUANTIZE_INT8 setting)
         """
-        if pipeline is not None:
-            # Share existing pipeline (pipeline reuse pattern)
-            self._pipeline = pipeline
-        else:
-            # Create new pipeline
-            from transformers import pipeline as create_pipeline
-
-            self._pipeline = create_pipeline("zero-shot-classification", model=model_name)
+        self._model_name = model_name
+        self._quantize = quantize
+        # Share existing pipeline when given (pipeline reuse pattern)
+        self._shared_pipeline = pipeline
+        self._pipeline_lock = threading.Lock()
+
+        # LRU cache of positive-label scores keyed by (headline, positive label)
+        self._score_cache = ZeroShotScoreCache(self.SCORE_CACHE_SIZE)
+
+    @property
+    def _pipeline(self):
+        """Zero-shot pipeline, created on first use unless one was shared."""
+        if self._shared_pipeline is None:
+            with self._pipeline_lock:
+                if self._shared_pipeline is None:
+                    # ONNX Runtime when available, else PyTorch
+                    self._shared_pipeline = create_zero_shot_pipeline(
+                        self._model_name, quantize=self._quantize
+                    )
+        return self._shared_pipeline
 
     def detect(self, headline: Optional[str]) -> StrategicCatalystResult:
         """Detect strategic catalyst in headline.
@@ -116,155 +150,200 @@ class StrategicCatalystDetectorMNLS:
         Returns:
             StrategicCatalystResult with detection details
         """
-        logger.debug(
-            "Starting strategic catalyst detection",
-            headline_length=len(headline) if headline else 0,
-        )
-        start_time = time.time()
+        return self.detect_batch([headline])[0]
 
-        # Handle None/empty input
-        if not headline:
-            logger.warning("Empty headline provided for strategic catalyst detection")
-            return StrategicCatalystResult(
-                headline=headline or "",
-                has_strategic_catalyst=False,
-                catalyst_subtype=None,
-                confidence=0.0,
-            )
+    def detect_batch(
+        self, headlines: list[Optional[str]]
+    ) -> list[StrategicCatalystResult]:
+        """Detect strategic catalysts in multiple headlines.
 
-        # Step 0: Quantitative pre-filter - reject headlines with financial values
-        # Check for dollar amounts, percentages, and financial keywords
-        has_dollar_amount = bool(self.DOLLAR_PATTERN.search(headline))
-        has_percentage = bool(self.PERCENTAGE_PATTERN.search(headline))
-        has_financial_keyword = bool(self.FINANCIAL_KEYWORDS.search(headline))
+        Runs each MNLI stage (presence, then type classification) as a single
+        batched pipeline call across all headlines that reach that stage,
+        instead of one forward pass per headline.
 
-        # Reject headlines with quantitative financial indicators:
-        # - Any dollar amount (signals quantitative catalyst like acquisition value, dividend amount)
-        # - Percentage + financial keyword (signals quantitative results like earnings growth)
-        # - Financial keyword alone (signals financial results like earnings, revenue reports)
-        if has_dollar_amount or (has_percentage and has_financial_keyword) or has_financial_keyword:
-            duration = time.time() - start_time
-            logger.info(
-                "Strategic catalyst rejected by quantitative pre-filter",
-                has_dollar=has_dollar_amount,
-                has_percentage=has_percentage,
-                has_financial_keyword=has_financial_keyword,
-                duration_ms=round(duration * 1000, 2),
-            )
-            return StrategicCatalystResult(
-                headline=headline,
-                has_strategic_catalyst=False,
-                catalyst_subtype=None,
-                confidence=0.0,
-            )
+        Args:
+            headlines: News article headlines to analyze
 
-        # Step 1: MNLI presence check
-        logger.debug("Running MNLI presence detection")
-        presence_score = self._check_presence(headline)
-        logger.debug(
-            "MNLI presence detection completed", presence_score=round(presence_score, 3)
-        )
+        Returns:
+            List of StrategicCatalystResult in same order as input
+        """
+        logger.debug("Starting strategic catalyst detection", batch_size=len(headlines))
+        start_time = time.time()
 
-        # Fast path: If MNLI says not a catalyst, return negative result
-        if presence_score < self.PRESENCE_THRESHOLD:
-            duration = time.time() - start_time
-            logger.info(
-                "Strategic catalyst not detected (presence score below threshold)",
+        results: list[Optional[StrategicCatalystResult]] = [None] * len(headlines)
+
+        # Handle None/empty input and the quantitative pre-filter
+        pending = []
+        for index, headline in enumerate(headlines):
+            if not headline:
+                logger.warning("Empty headline provided for strategic catalyst detection")
+                results[index] = self._negative_result(headline or "")
+            elif self._is_quantitative(headline):
+                results[index] = self._negative_result(headline)
+            else:
+                pending.append(index)
+
+        # Step 1: MNLI presence check (one batched call)
+        logger.debug("Running MNLI presence detection", batch_size=len(pending))
+        presence_scores = self._check_presence_batch([headlines[i] for i in pending])
+
+        candidates = []
+        for index, presence_score in zip(pending, presence_scores):
+            logger.debug(
+                "MNLI presence detection completed",
                 presence_score=round(presence_score, 3),
-                threshold=self.PRESENCE_THRESHOLD,
-                duration_ms=round(duration * 1000, 2),
-            )
-            return StrategicCatalystResult(
-                headline=headline,
-                has_strategic_catalyst=False,
-                catalyst_subtype=None,
-                confidence=presence_score,
             )
 
-        # Step 2: Classify catalyst type using MNLI
-        logger.debug("Classifying catalyst subtype")
-        type_result = self._classify_type(headline)
-        catalyst_subtype = type_result["type"]
-        type_score = type_result["confidence"]
-        logger.debug(
-            "Type classification completed",
-            catalyst_subtype=catalyst_subtype,
-            type_score=round(type_score, 3),
-        )
+            # Fast path: If MNLI says not a catalyst, return negative result
+            if presence_score < self.PRESENCE_THRESHOLD:
+                logger.info(
+                    "Strategic catalyst not detected (presence score below threshold)",
+                    presence_score=round(presence_score, 3),
+                    threshold=self.PRESENCE_THRESHOLD,
+                )
+                results[index] = StrategicCatalystResult(
+                    headline=headlines[index],
+                    has_strategic_catalyst=False,
+                    catalyst_subtype=None,
+                    confidence=presence_score,
+                )
+            else:
+                candidates.append(index)
 
-        # Step 3: Use type classification score as confidence
-        confidence = type_score
+        # Step 2: Classify catalyst type (one batched call per type)
+        logger.debug("Classifying catalyst subtype", batch_size=len(candidates))
+        type_results = self._classify_type_batch([headlines[i] for i in candidates])
 
-        # Final decision: Has catalyst if presence detected
-        has_catalyst = True
+        for index, type_result in zip(candidates, type_results):
+            catalyst_subtype = type_result["type"]
+            # Step 3: Use type classification score as confidence
+            confidence = type_result["confidence"]
+            logger.info(
+                "Strategic catalyst detection completed",
+                has_catalyst=True,
+                catalyst_subtype=catalyst_subtype,
+                confidence=round(confidence, 3),
+            )
+            # Final decision: Has catalyst if presence detected
+            results[index] = StrategicCatalystResult(
+                headline=headlines[index],
+                has_strategic_catalyst=True,
+                catalyst_subtype=catalyst_subtype,
+                confidence=confidence,
+            )
 
         duration = time.time() - start_time
-        logger.info(
-            "Strategic catalyst detection completed",
-            has_catalyst=has_catalyst,
-            catalyst_subtype=catalyst_subtype,
-            confidence=round(confidence, 3),
+        logger.debug(
+            "Strategic catalyst batch completed",
+            batch_size=len(headlines),
             duration_ms=round(duration * 1000, 2),
         )
 
+        return results
+
+    def _negative_result(self, headline: str) -> StrategicCatalystResult:
+        """Build the negative result returned when no catalyst is present."""
         return StrategicCatalystResult(
             headline=headline,
-            has_strategic_catalyst=has_catalyst,
-            catalyst_subtype=catalyst_subtype,
-            confidence=confidence,
+            has_strategic_catalyst=False,
+            catalyst_subtype=None,
+            confidence=0.0,
         )
 
-    def _check_presence(self, headline: str) -> float:
-        """Check if headline announces a strategic catalyst using MNLI.
+    def _is_quantitative(self, headline: str) -> bool:
+        """Quantitative pre-filter: reject headlines with financial values.
 
         Args:
-            headline: Headline text to check
+            headline: Non-empty headline text
 
         Returns:
-            Float score (0.0-1.0) indicating confidence that headline
-            announces a strategic catalyst
+            True if the headline signals a quantitative rather than strategic
+            catalyst
         """
-        result = self._pipeline(headline, self.PRESENCE_LABELS)
+        # Reject headlines with quantitative financial indicators:
+        # - Any dollar amount (signals quantitative catalyst like acquisition value, dividend amount)
+        # - Any financial keyword (signals financial results like earnings, revenue reports,
+        #   with or without a percentage)
+        match = self.QUANTITATIVE_PREFILTER.search(headline)
+        if match:
+            logger.info(
+                "Strategic catalyst rejected by quantitative pre-filter",
+                matched=match.group(0),
+            )
+            return True
+        return False
+
+    def _positive_label_scores(
+        self, headlines: list[str], labels: list[str]
+    ) -> list[float]:
+        """Score the first (positive) label for each headline in one pipeline call.
 
-        # Extract score for "announces catalyst" label (first label)
-        if result["labels"][0] == self.PRESENCE_LABELS[0]:
-            # Top prediction is "catalyst" - use its score
-            return result["scores"][0]
-        else:
-            # Top prediction is "not catalyst" - return catalyst score (second)
-            return result["scores"][1]
+        Scores are cached per (headline, positive label), so repeated headlines
+        skip the forward pass.
 
-    def _classify_type(self, headline: str) -> dict:
+        Args:
+            headlines: Headline texts to classify
+            labels: Candidate labels, positive label first
+
+        Returns:
+            Positive-label score (0.0-1.0) for each headline, in input order
+        """
+        if not headlines:
+            # Nothing to score, so don't load the lazy pipeline
+            return []
+        return self._score_cache.score(self._pipeline, headlines, labels, labels[0])
+
+    def _check_presence_batch(self, headlines: list[str]) -> list[float]:
+        """Check if headlines announce a strategic catalyst using MNLI.
+
+        Args:
+            headlines: Headline texts to check
+
+        Returns:
+            Float score (0.0-1.0) per headline indicating confidence that it
+            announces a strategic catalyst
+        """
+        return self._positive_label_scores(headlines, self.PRESENCE_LABELS)
+
+    def _classify_type_batch(self, headlines: list[str]) -> list[dict]:
         """Classify catalyst type using MNLI.
 
-        Tests headline against all 6 catalyst type labels and returns
-        the highest-scoring type. Returns "mixed" if best score < threshold.
+        Tests each headline against all 6 catalyst type labels (one batched
+        pipeline call per type) and returns the highest-scoring type.
+        Returns "mixed" if best score < threshold.
 
         Args:
-            headline: Headline text to classify
+            headlines: Headline texts to classify
 
         Returns:
-            Dict with:
-                - type: str (executive_change/strategic_partnership/product_launch/
-                         merger_agreement/rebranding/clinical_trial_results/mixed)
+            List of dicts (one per headline) with:
+                - type: str (executive_changes/m&a/partnership/product_launch/
+                         corporate_restructuring/clinical_trial/mixed)
                 - confidence: float (0.0-1.0, score of best type)
         """
-        type_scores = {}
+        type_scores = [{} for _ in headlines]
 
         # Test each catalyst type
         for catalyst_type, labels in self.CATALYST_TYPE_LABELS.items():
-            result = self._pipeline(headline, labels)
+            scores = self._positive_label_scores(headlines, labels)
+            for headline_scores, score in zip(type_scores, scores):
+                headline_scores[catalyst_type] = score
 
-            # Extract score for positive label (first label)
-            if result["labels"][0] == labels[0]:
-                # Top prediction is this type - use its score
-                score = result["scores"][0]
-            else:
-                # Top prediction is negative - use type score (second)
-                score = result["scores"][1]
+        return [
+            self._select_type(headline, headline_scores)
+            for headline, headline_scores in zip(headlines, type_scores)
+        ]
 
-            type_scores[catalyst_type] = score
+    def _select_type(self, headline: str, type_scores: dict[str, float]) -> dict:
+        """Pick the catalyst type for one headline from its per-type scores.
 
+        Args:
+            headline: Headline text the scores belong to
+            type_scores: Positive-label score per catalyst type
+
+        Returns:
+            Dict with type and confidence (see _classify_type_batch)
+        """
         # Find highest-scoring type
         best_type = max(type_scores, key=type_scores.get)
         best_score = type_scores[best_type]
@@ -282,8 +361,9 @@ class StrategicCatalystDetectorMNLS:
         # partnership and product_launch are semantically valid, but the actual
         # launch action is the primary catalyst (partnerships are preparatory)
         # Also handles cases where product_launch score is low but keyword is present
-        headline_lower = headline.lower()
-        has_launch_keyword = any(keyword in headline_lower for keyword in ['launch', 'launches', 'launching'])
+        # "launch" is a substring of "launches" and "launching", so one
+        # substring test covers all three forms
+        has_launch_keyword = "launch" in headline.lower()
         disambiguated = False
         if (has_launch_keyword and
             'product_launch' in type_scores and
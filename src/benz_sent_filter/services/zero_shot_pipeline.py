@@ -0,0 +1,240 @@
+"""Zero-shot classification pipeline construction.
+
+This module builds the transformers zero-shot pipelines used by the MNLI
+detectors. An exported ONNX Runtime model is used only when opted in via
+ONNX_RUNTIME (or a quantized model is requested) and the optional ``onnx``
+extra is installed.
+"""
+
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import torch
+from loguru import logger
+
+from benz_sent_filter.config.settings import ONNX_RUNTIME
+
+# Exported ONNX models are cached here so the export cost is paid only once
+ONNX_CACHE_DIR = Path.home() / ".cache" / "benz_sent_filter" / "onnx"
+
+# File names inside a model's export directory (optimum appends "_optimized"
+# and "_quantized" to the source file name)
+ONNX_MODEL_FILE = "model.onnx"
+ONNX_OPTIMIZED_MODEL_FILE = "model_optimized.onnx"
+ONNX_QUANTIZED_MODEL_FILE = "model_optimized_quantized.onnx"
+
+# ONNX Runtime graph optimization level applied after export: 2 adds the
+# LayerNorm/GELU/attention fusions but, unlike 3, keeps exact GELU so scores
+# match the PyTorch model
+ONNX_OPTIMIZATION_LEVEL = 2
+
+
+class ZeroShotScoreCache:
+    """Thread-safe LRU cache of zero-shot label scores per headline.
+
+    Sits in front of a zero-shot pipeline so repeated headlines skip the
+    forward pass. Only cache misses are sent to the pipeline, each unique
+    headline once, in a single batched call.
+
+    Attributes:
+        max_size: Maximum number of (headline, label) scores kept
+    """
+
+    def __init__(self, max_size: int):
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of (headline, label) scores kept
+        """
+        self.max_size = max_size
+        self._scores: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def clear(self) -> None:
+        """Drop every cached score."""
+        with self._lock:
+            self._scores.clear()
+
+    def score(
+        self, pipeline, headlines: list[str], labels: list[str], label: str
+    ) -> list[float]:
+        """Score one candidate label for each headline.
+
+        Args:
+            pipeline: Zero-shot pipeline, called only for cache misses
+            headlines: Headline texts to classify
+            labels: Candidate labels passed to the pipeline
+            label: Candidate label whose score is returned
+
+        Returns:
+            Score (0.0-1.0) of ``label`` for each headline, in input order
+        """
+        if not headlines:
+            return []
+
+        unique_headlines = list(dict.fromkeys(headlines))
+        scores_by_headline = {}
+
+        with self._lock:
+            for headline in unique_headlines:
+                key = (headline, label)
+                if key in self._scores:
+                    self._scores.move_to_end(key)
+                    scores_by_headline[headline] = self._scores[key]
+
+        misses = [h for h in unique_headlines if h not in scores_by_headline]
+        if misses:
+            # inference_mode skips autograd and tensor version tracking entirely
+            with torch.inference_mode():
+                outputs = pipeline(misses, labels)
+            # Pipeline returns a bare dict when given a single sequence
+            if isinstance(outputs, dict):
+                outputs = [outputs]
+
+            for headline, result in zip(misses, outputs):
+                # Results are sorted by score, so look the label up by position
+                scores_by_headline[headline] = result["scores"][
+                    result["labels"].index(label)
+                ]
+
+            with self._lock:
+                for headline in misses:
+                    self._scores[(headline, label)] = scores_by_headline[headline]
+                # Evict oldest entries once the cache is over capacity
+                while len(self._scores) > self.max_size:
+                    self._scores.popitem(last=False)
+
+        return [scores_by_headline[headline] for headline in headlines]
+
+
+def _publish(staging_dir: Path, export_dir: Path, marker: str) -> None:
+    """Move files written to staging_dir into export_dir.
+
+    Each file is moved with os.replace, which is atomic on the same
+    filesystem, and the marker file goes last. A half-written export is
+    therefore never visible, and its marker only appears once everything
+    it depends on is in place. Concurrent processes (e.g. pytest-xdist
+    workers) that export the same model just replace each other's complete
+    files.
+
+    Args:
+        staging_dir: Temporary directory the step saved its files to
+        export_dir: Shared cache directory for the model
+        marker: File name whose presence means the step has completed
+    """
+    export_dir.mkdir(parents=True, exist_ok=True)
+    for path in sorted(staging_dir.iterdir(), key=lambda p: p.name == marker):
+        os.replace(path, export_dir / path.name)
+
+
+def create_zero_shot_pipeline(model_name: str, quantize: bool = False):
+    """Create a zero-shot pipeline, using ONNX Runtime when opted in.
+
+    The regular PyTorch pipeline (the one the detector thresholds were tuned
+    on) is used unless ONNX_RUNTIME is enabled or a quantized model is
+    requested. Then optimum's ORTModelForSequenceClassification (exported
+    once, graph optimized with operator fusion and cached under
+    ONNX_CACHE_DIR) is used when the optional ``onnx`` extra is installed,
+    falling back to PyTorch otherwise or if export fails. Every export step writes
+    to a private staging directory and is then published into the cache, so
+    concurrent processes never read partially written model files.
+
+    Args:
+        model_name: HuggingFace model name for zero-shot classification
+        quantize: Run a dynamically int8-quantized copy of the exported model
+            (AVX-512 VNNI config; quantized once and cached next to the export).
+            Implies ONNX Runtime.
+
+    Returns:
+        transformers zero-shot-classification pipeline
+    """
+    from transformers import pipeline as create_pipeline
+
+    if not (ONNX_RUNTIME or quantize):
+        logger.info("Using PyTorch zero-shot pipeline", model_name=model_name)
+        return create_pipeline("zero-shot-classification", model=model_name)
+
+    try:
+        from optimum.onnxruntime import (
+            ORTModelForSequenceClassification,
+            ORTOptimizer,
+            ORTQuantizer,
+        )
+        from optimum.onnxruntime.configuration import (
+            AutoQuantizationConfig,
+            OptimizationConfig,
+        )
+        from transformers import AutoTokenizer
+    except ImportError:
+        logger.info(
+            "optimum not installed, using PyTorch zero-shot pipeline",
+            model_name=model_name,
+        )
+        return create_pipeline("zero-shot-classification", model=model_name)
+
+    export_dir = ONNX_CACHE_DIR / model_name.replace("/", "--")
+    file_name = ONNX_QUANTIZED_MODEL_FILE if quantize else ONNX_OPTIMIZED_MODEL_FILE
+    try:
+        ONNX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+        if not (export_dir / ONNX_MODEL_FILE).exists():
+            logger.info("Exporting model to ONNX", model_name=model_name, path=str(export_dir))
+            with tempfile.TemporaryDirectory(dir=ONNX_CACHE_DIR) as staging:
+                model = ORTModelForSequenceClassification.from_pretrained(
+                    model_name, export=True
+                )
+                tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+                model.save_pretrained(staging)
+                tokenizer.save_pretrained(staging)
+                _publish(Path(staging), export_dir, ONNX_MODEL_FILE)
+
+        if not (export_dir / ONNX_OPTIMIZED_MODEL_FILE).exists():
+            logger.info("Optimizing ONNX graph", model_name=model_name, path=str(export_dir))
+            with tempfile.TemporaryDirectory(dir=ONNX_CACHE_DIR) as staging:
+                optimizer = ORTOptimizer.from_pretrained(
+                    export_dir, file_names=[ONNX_MODEL_FILE]
+                )
+                optimizer.optimize(
+                    save_dir=staging,
+                    optimization_config=OptimizationConfig(
+                        optimization_level=ONNX_OPTIMIZATION_LEVEL
+                    ),
+                )
+                _publish(Path(staging), export_dir, ONNX_OPTIMIZED_MODEL_FILE)
+
+        if quantize and not (export_dir / ONNX_QUANTIZED_MODEL_FILE).exists():
+            logger.info("Quantizing ONNX model to int8", model_name=model_name, path=str(export_dir))
+            with tempfile.TemporaryDirectory(dir=ONNX_CACHE_DIR) as staging:
+                quantizer = ORTQuantizer.from_pretrained(
+                    export_dir, file_name=ONNX_OPTIMIZED_MODEL_FILE
+                )
+                quantizer.quantize(
+                    save_dir=staging,
+                    quantization_config=AutoQuantizationConfig.avx512_vnni(
+                        is_static=False, per_channel=False
+                    ),
+                )
+                _publish(Path(staging), export_dir, ONNX_QUANTIZED_MODEL_FILE)
+
+        model = ORTModelForSequenceClassification.from_pretrained(
+            export_dir, file_name=file_name
+        )
+        tokenizer = AutoTokenizer.from_pretrained(export_dir, use_fast=True)
+    except (OSError, RuntimeError, ValueError) as e:
+        logger.warning(
+            "ONNX export failed, using PyTorch zero-shot pipeline",
+            model_name=model_name,
+            error=str(e),
+        )
+        return create_pipeline("zero-shot-classification", model=model_name)
+
+    logger.info(
+        "Using ONNX Runtime zero-shot pipeline", model_name=model_name, file_name=file_name
+    )
+    return create_pipeline("zero-shot-classification", model=model, tokenizer=tokenizer)
@@ -1,6 +1,156 @@
 """Pytest configuration and fixtures for benz_sent_filter tests."""
 
+import os
+import sys
+
 import pytest
+from hypothesis import settings
+
+from benz_sent_filter.services.routine_detector import RoutineOperationDetector
+
+# Bounded example count and no per-example deadline for CI runs:
+#   pytest --hypothesis-profile=ci
+settings.register_profile("ci", max_examples=100, deadline=None)
+
+# Under pytest-xdist every worker loads its own MNLI model; split the cores
+# between workers so their intra-op thread pools do not oversubscribe the
+# CPU (MKL follows the same count). Set here, before any test imports torch;
+# an explicit OMP_NUM_THREADS/MKL_NUM_THREADS still wins. If a plugin already
+# imported torch, the env var is too late, so the thread count is applied to
+# torch directly. The Rust tokenizer's own thread pool is switched off for
+# the same reason.
+_XDIST_WORKER_COUNT = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+if _XDIST_WORKER_COUNT > 1:
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+    os.environ.setdefault(
+        "OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // _XDIST_WORKER_COUNT))
+    )
+    os.environ.setdefault("MKL_NUM_THREADS", os.environ["OMP_NUM_THREADS"])
+    if "torch" in sys.modules:
+        sys.modules["torch"].set_num_threads(int(os.environ["OMP_NUM_THREADS"]))
+
+
+@pytest.fixture(scope="session")
+def warmup_pydantic_schemas():
+    """Exercise each classification model once before the first test runs.
+
+    Validating a minimal instance of every model up front keeps first-hit
+    validator/serializer setup out of individual test timings.
+    """
+    from benz_sent_filter.models.classification import (
+        BatchClassificationResult,
+        BatchClassifyRequest,
+        ClassificationResult,
+        ClassificationScores,
+        ClassifyRequest,
+        CoreClassification,
+        MultiTickerRoutineRequest,
+        MultiTickerRoutineResponse,
+        RoutineOperationResult,
+        TemporalCategory,
+    )
+
+    scores = ClassificationScores(
+        opinion_score=0.5,
+        news_score=0.5,
+        past_score=0.3,
+        future_score=0.3,
+        general_score=0.4,
+    )
+    result = ClassificationResult(
+        is_opinion=False,
+        is_straight_news=False,
+        temporal_category=TemporalCategory.GENERAL_TOPIC,
+        scores=scores,
+        headline="warmup",
+    )
+    BatchClassificationResult(results=[result]).model_dump()
+    ClassifyRequest(headline="warmup")
+    BatchClassifyRequest(headlines=["warmup"])
+    MultiTickerRoutineRequest(headline="warmup", company_symbol="BAC")
+    MultiTickerRoutineResponse(
+        headline="warmup",
+        core_classification=CoreClassification(
+            is_opinion=False,
+            is_straight_news=False,
+            temporal_category="general_topic",
+            scores=scores.model_dump(),
+        ),
+        routine_operations_by_ticker={
+            "BAC": RoutineOperationResult(
+                routine_operation=False,
+                routine_confidence=0.5,
+                routine_metadata={},
+            )
+        },
+    ).model_dump()
+
+
+@pytest.fixture(scope="session")
+def quantitative_detector():
+    """Real-model quantitative catalyst detector shared across the session.
+
+    Tests only call detect()/detect_batch(), so the loaded MNLI pipeline is
+    reused instead of reloading model weights per test. Under pytest-xdist
+    each worker builds its own instance once; nothing is shared between
+    workers, so the detector never needs to be pickled.
+
+    One warmup headline is run through both MNLI stages before the first
+    test, so lazy tokenizer setup and first-forward-pass costs are not
+    charged to whichever test happens to run first.
+    """
+    from benz_sent_filter.services.quantitative_catalyst_detector_mnls import (
+        QuantitativeCatalystDetectorMNLS,
+    )
+
+    detector = QuantitativeCatalystDetectorMNLS()
+    detector.detect_batch(["Company Declares $1 Dividend"])
+    return detector
+
+
+@pytest.fixture(scope="session")
+def routine_detector():
+    """Regex-based routine operation detector shared across the session.
+
+    detect() and the materiality helpers are pure (the result cache only
+    memoizes), so tests share one instance; tests that exercise construction
+    or the cache build their own. Under pytest-xdist
+    (``pytest -n auto tests/test_routine_detector.py``) each worker builds
+    it once.
+
+    The class is imported at module level, like the test modules do, so the
+    instance matches their RoutineOperationDetector even after test_api.py
+    evicts benz_sent_filter modules from sys.modules.
+    """
+    return RoutineOperationDetector()
+
+
+@pytest.fixture(scope="session")
+def routine_detector_mnls():
+    """Real-model MNLS routine detector shared across the session.
+
+    The detector holds no per-call state besides the zero-shot pipeline, so
+    reusing one instance loads the MNLI weights once instead of per test.
+    """
+    from benz_sent_filter.services.routine_detector_mnls import (
+        RoutineOperationDetectorMNLS,
+    )
+
+    return RoutineOperationDetectorMNLS()
+
+
+@pytest.fixture(scope="session")
+def strategic_detector():
+    """Real-model strategic catalyst detector shared across the session.
+
+    detect() keeps no per-call state, so every test reuses one instance and
+    the MNLI pipeline is built once per run instead of once per test.
+    """
+    from benz_sent_filter.services.strategic_catalyst_detector_mnls import (
+        StrategicCatalystDetectorMNLS,
+    )
+
+    return StrategicCatalystDetectorMNLS()
 
 
 @pytest.fixture
@@ -58,11 +208,16 @@ def mock_transformers_pipeline(monkeypatch):
     score_dict_container = [{}]
 
     def _mock_pipeline(task, model):
-        def pipeline_fn(text, candidate_labels):
+        def pipeline_fn(text, candidate_labels, **kwargs):
             # Use the current score dict from the container
             scores = [
                 score_dict_container[0].get(label, 0.2) for label in candidate_labels
             ]
+            # Mirror transformers: a list of sequences returns a list of results
+            if isinstance(text, list):
+                return [
+                    {"labels": candidate_labels, "scores": scores} for _ in text
+                ]
             return {"labels": candidate_labels, "scores": scores}
 
         return pipeline_fn
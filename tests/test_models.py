@@ -1,7 +1,32 @@
 """Tests for data models."""
 
+import json
+import re
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+
+from benz_sent_filter.models.classification import ClassificationScores
+
+pytestmark = pytest.mark.usefixtures("warmup_pydantic_schemas")
+
+# Precompiled match for validation errors raised on the headline(s) field
+_HEADLINE_FIELD_RE = re.compile(r"headline", re.IGNORECASE)
+
+# Shared adapter and default payload for building ClassificationScores fixtures
+_SCORES_ADAPTER = TypeAdapter(ClassificationScores)
+_DEFAULT_SCORES_PAYLOAD = {
+    "opinion_score": 0.8,
+    "news_score": 0.2,
+    "past_score": 0.1,
+    "future_score": 0.7,
+    "general_score": 0.2,
+}
+
+
+def make_scores(**overrides: float) -> ClassificationScores:
+    """Build ClassificationScores from the default payload with optional overrides."""
+    return _SCORES_ADAPTER.validate_python({**_DEFAULT_SCORES_PAYLOAD, **overrides})
 
 
 def test_temporal_category_enum_values():
@@ -34,7 +59,7 @@ def test_classify_request_empty_headline_rejected():
     """Test ClassifyRequest rejects empty headline."""
     from benz_sent_filter.models.classification import ClassifyRequest
 
-    with pytest.raises(ValidationError) as exc_info:
+    with pytest.raises(ValidationError, match=_HEADLINE_FIELD_RE) as exc_info:
         ClassifyRequest(headline="")
 
     errors = exc_info.value.errors()
@@ -55,7 +80,7 @@ def test_batch_classify_request_empty_list_rejected():
     """Test BatchClassifyRequest rejects empty headlines list."""
     from benz_sent_filter.models.classification import BatchClassifyRequest
 
-    with pytest.raises(ValidationError) as exc_info:
+    with pytest.raises(ValidationError, match=_HEADLINE_FIELD_RE) as exc_info:
         BatchClassifyRequest(headlines=[])
 
     errors = exc_info.value.errors()
@@ -64,8 +89,6 @@ def test_batch_classify_request_empty_list_rejected():
 
 def test_classification_scores_all_fields():
     """Test ClassificationScores has all required score fields."""
-    from benz_sent_filter.models.classification import ClassificationScores
-
     scores = ClassificationScores(
         opinion_score=0.8,
         news_score=0.2,
@@ -91,17 +114,10 @@ def test_classification_result_structure():
     """Test ClassificationResult has all required fields with correct types."""
     from benz_sent_filter.models.classification import (
         ClassificationResult,
-        ClassificationScores,
         TemporalCategory,
     )
 
-    scores = ClassificationScores(
-        opinion_score=0.8,
-        news_score=0.2,
-        past_score=0.1,
-        future_score=0.7,
-        general_score=0.2,
-    )
+    scores = make_scores()
 
     result = ClassificationResult(
         is_opinion=True,
@@ -128,17 +144,10 @@ def test_batch_classification_result_structure():
     from benz_sent_filter.models.classification import (
         BatchClassificationResult,
         ClassificationResult,
-        ClassificationScores,
         TemporalCategory,
     )
 
-    scores = ClassificationScores(
-        opinion_score=0.8,
-        news_score=0.2,
-        past_score=0.1,
-        future_score=0.7,
-        general_score=0.2,
-    )
+    scores = make_scores()
 
     result1 = ClassificationResult(
         is_opinion=True,
@@ -160,7 +169,7 @@ def test_batch_classification_result_structure():
 
     assert isinstance(batch_result.results, list)
     assert len(batch_result.results) == 2
-    assert all(isinstance(r, ClassificationResult) for r in batch_result.results)
+    assert {type(r) for r in batch_result.results} == {ClassificationResult}
     assert batch_result.results[0].headline == "Headline 1"
     assert batch_result.results[1].headline == "Headline 2"
 
@@ -168,48 +177,32 @@ def test_batch_classification_result_structure():
 # Phase 1: Company Relevance Detection - Request Model Tests
 
 
-def test_classify_request_with_company_parameter():
-    """Test ClassifyRequest validates successfully with company parameter."""
+@pytest.mark.parametrize(
+    "kwargs, expected_company",
+    [
+        ({"headline": "Test headline", "company": "Dell"}, "Dell"),
+        ({"headline": "Test headline"}, None),
+        ({"headline": "Test headline", "company": None}, None),
+    ],
+    ids=["with_company", "defaults_none", "explicit_none"],
+)
+def test_classify_request_company_parameter(kwargs, expected_company):
+    """Test ClassifyRequest accepts an optional company parameter defaulting to None."""
     from benz_sent_filter.models.classification import ClassifyRequest
 
-    request = ClassifyRequest(headline="Test headline", company="Dell")
+    request = ClassifyRequest(**kwargs)
     assert request.headline == "Test headline"
-    assert request.company == "Dell"
-
-
-def test_classify_request_without_company_parameter_defaults_none():
-    """Test ClassifyRequest without company parameter defaults to None."""
-    from benz_sent_filter.models.classification import ClassifyRequest
-
-    request = ClassifyRequest(headline="Test headline")
-    assert request.headline == "Test headline"
-    assert request.company is None
-
-
-def test_classify_request_with_none_company_explicit():
-    """Test ClassifyRequest with explicit None company parameter."""
-    from benz_sent_filter.models.classification import ClassifyRequest
-
-    request = ClassifyRequest(headline="Test headline", company=None)
-    assert request.headline == "Test headline"
-    assert request.company is None
+    assert request.company == expected_company
 
 
 def test_classification_result_with_company_fields_present():
     """Test ClassificationResult serializes correctly with company fields present."""
     from benz_sent_filter.models.classification import (
         ClassificationResult,
-        ClassificationScores,
         TemporalCategory,
     )
 
-    scores = ClassificationScores(
-        opinion_score=0.8,
-        news_score=0.2,
-        past_score=0.1,
-        future_score=0.7,
-        general_score=0.2,
-    )
+    scores = make_scores()
 
     result = ClassificationResult(
         is_opinion=True,
@@ -241,17 +234,10 @@ def test_classification_result_with_company_fields_none():
     """Test ClassificationResult with company fields set to None."""
     from benz_sent_filter.models.classification import (
         ClassificationResult,
-        ClassificationScores,
         TemporalCategory,
     )
 
-    scores = ClassificationScores(
-        opinion_score=0.8,
-        news_score=0.2,
-        past_score=0.1,
-        future_score=0.7,
-        general_score=0.2,
-    )
+    scores = make_scores()
 
     result = ClassificationResult(
         is_opinion=True,
@@ -274,17 +260,10 @@ def test_classification_result_json_excludes_none_company_fields():
     """Test ClassificationResult JSON serialization excludes None company fields."""
     from benz_sent_filter.models.classification import (
         ClassificationResult,
-        ClassificationScores,
         TemporalCategory,
     )
 
-    scores = ClassificationScores(
-        opinion_score=0.8,
-        news_score=0.2,
-        past_score=0.1,
-        future_score=0.7,
-        general_score=0.2,
-    )
+    scores = make_scores()
 
     # Create result without company fields (defaults to None)
     result = ClassificationResult(
@@ -306,22 +285,21 @@ def test_classification_result_json_excludes_none_company_fields():
     assert "headline" in result_dict
 
 
-def test_batch_classify_request_with_company_parameter():
-    """Test BatchClassifyRequest with company parameter."""
-    from benz_sent_filter.models.classification import BatchClassifyRequest
-
-    request = BatchClassifyRequest(headlines=["h1", "h2"], company="Tesla")
-    assert len(request.headlines) == 2
-    assert request.company == "Tesla"
-
-
-def test_batch_classify_request_without_company_defaults_none():
-    """Test BatchClassifyRequest without company defaults to None."""
+@pytest.mark.parametrize(
+    "kwargs, expected_company",
+    [
+        ({"headlines": ["h1", "h2"], "company": "Tesla"}, "Tesla"),
+        ({"headlines": ["h1", "h2"]}, None),
+    ],
+    ids=["with_company", "defaults_none"],
+)
+def test_batch_classify_request_company_parameter(kwargs, expected_company):
+    """Test BatchClassifyRequest accepts an optional company parameter defaulting to None."""
     from benz_sent_filter.models.classification import BatchClassifyRequest
 
-    request = BatchClassifyRequest(headlines=["h1", "h2"])
+    request = BatchClassifyRequest(**kwargs)
     assert len(request.headlines) == 2
-    assert request.company is None
+    assert request.company == expected_company
 
 
 # ============================================================================
@@ -333,17 +311,10 @@ def test_classification_result_with_far_future_fields_present():
     """Test ClassificationResult accepts and serializes far-future forecast fields."""
     from benz_sent_filter.models.classification import (
         ClassificationResult,
-        ClassificationScores,
         TemporalCategory,
     )
 
-    scores = ClassificationScores(
-        opinion_score=0.2,
-        news_score=0.8,
-        past_score=0.1,
-        future_score=0.7,
-        general_score=0.2,
-    )
+    scores = make_scores(opinion_score=0.2, news_score=0.8)
 
     result = ClassificationResult(
         is_opinion=False,
@@ -371,17 +342,10 @@ def test_classification_result_with_far_future_fields_none():
     """Test ClassificationResult with far-future fields set to None."""
     from benz_sent_filter.models.classification import (
         ClassificationResult,
-        ClassificationScores,
         TemporalCategory,
     )
 
-    scores = ClassificationScores(
-        opinion_score=0.2,
-        news_score=0.8,
-        past_score=0.7,
-        future_score=0.1,
-        general_score=0.2,
-    )
+    scores = make_scores(opinion_score=0.2, news_score=0.8, past_score=0.7, future_score=0.1)
 
     result = ClassificationResult(
         is_opinion=False,
@@ -402,17 +366,10 @@ def test_classification_result_json_excludes_none_far_future_fields():
     """Test ClassificationResult JSON serialization excludes None far-future fields."""
     from benz_sent_filter.models.classification import (
         ClassificationResult,
-        ClassificationScores,
         TemporalCategory,
     )
 
-    scores = ClassificationScores(
-        opinion_score=0.2,
-        news_score=0.8,
-        past_score=0.7,
-        future_score=0.1,
-        general_score=0.2,
-    )
+    scores = make_scores(opinion_score=0.2, news_score=0.8, past_score=0.7, future_score=0.1)
 
     # Create result without far-future fields (defaults to None)
     result = ClassificationResult(
@@ -438,17 +395,10 @@ def test_classification_result_far_future_without_company_fields():
     """Test ClassificationResult with far-future fields but no company fields."""
     from benz_sent_filter.models.classification import (
         ClassificationResult,
-        ClassificationScores,
         TemporalCategory,
     )
 
-    scores = ClassificationScores(
-        opinion_score=0.2,
-        news_score=0.8,
-        past_score=0.1,
-        future_score=0.7,
-        general_score=0.2,
-    )
+    scores = make_scores(opinion_score=0.2, news_score=0.8)
 
     result = ClassificationResult(
         is_opinion=False,
@@ -479,17 +429,10 @@ def test_classification_result_all_optional_fields_present():
     """Test ClassificationResult with all optional fields (company + far-future) present."""
     from benz_sent_filter.models.classification import (
         ClassificationResult,
-        ClassificationScores,
         TemporalCategory,
     )
 
-    scores = ClassificationScores(
-        opinion_score=0.2,
-        news_score=0.8,
-        past_score=0.1,
-        future_score=0.7,
-        general_score=0.2,
-    )
+    scores = make_scores(opinion_score=0.2, news_score=0.8)
 
     result = ClassificationResult(
         is_opinion=False,
@@ -504,20 +447,23 @@ def test_classification_result_all_optional_fields_present():
         forecast_timeframe="by 2027",
     )
 
-    # Test all optional fields present
-    assert result.is_about_company is True
-    assert result.company_score == 0.90
-    assert result.company == "Dell"
-    assert result.far_future_forecast is True
-    assert result.forecast_timeframe == "by 2027"
-
-    # Test serialization includes all fields
+    # Serialize once and check all optional fields through the dict
     result_dict = result.model_dump()
     assert result_dict["is_about_company"] is True
+    assert result_dict["company_score"] == 0.90
     assert result_dict["company"] == "Dell"
     assert result_dict["far_future_forecast"] is True
     assert result_dict["forecast_timeframe"] == "by 2027"
 
+    # Populated optional fields survive exclude_none serialization
+    assert result.model_dump(exclude_none=True).keys() >= {
+        "is_about_company",
+        "company_score",
+        "company",
+        "far_future_forecast",
+        "forecast_timeframe",
+    }
+
 
 # ============================================================================
 # Phase 2: Multi-Ticker Response Models
@@ -626,43 +572,43 @@ def test_multi_ticker_routine_response_basic_structure():
 
 
 def test_multi_ticker_routine_response_json_serialization():
-    """Test MultiTickerRoutineResponse serializes correctly to JSON."""
-    from benz_sent_filter.models.classification import (
-        CoreClassification,
-        MultiTickerRoutineResponse,
-        RoutineOperationResult,
-    )
-
-    core = CoreClassification(
-        is_opinion=False,
-        is_straight_news=True,
-        temporal_category="general_topic",
-        scores={
-            "opinion_score": 0.2,
-            "news_score": 0.85,
-            "past_score": 0.3,
-            "future_score": 0.3,
-            "general_score": 0.4,
+    """Test MultiTickerRoutineResponse validates from and serializes back to JSON."""
+    from benz_sent_filter.models.classification import MultiTickerRoutineResponse
+
+    payload = """
+    {
+        "headline": "Test headline",
+        "core_classification": {
+            "is_opinion": false,
+            "is_straight_news": true,
+            "temporal_category": "general_topic",
+            "scores": {
+                "opinion_score": 0.2,
+                "news_score": 0.85,
+                "past_score": 0.3,
+                "future_score": 0.3,
+                "general_score": 0.4
+            }
         },
-    )
-
-    bac_routine = RoutineOperationResult(
-        routine_operation=True,
-        routine_confidence=0.87,
-        routine_metadata={"routine_score": 0.87},
-    )
-
-    response = MultiTickerRoutineResponse(
-        headline="Test headline",
-        core_classification=core,
-        routine_operations_by_ticker={"BAC": bac_routine},
-    )
+        "routine_operations_by_ticker": {
+            "BAC": {
+                "routine_operation": true,
+                "routine_confidence": 0.87,
+                "routine_metadata": {"routine_score": 0.87}
+            }
+        }
+    }
+    """
+
+    # Validate through the JSON input path
+    response = MultiTickerRoutineResponse.model_validate_json(payload)
+    assert response.headline == "Test headline"
+    assert response.core_classification.is_straight_news is True
+    assert "BAC" in response.routine_operations_by_ticker
+    assert response.routine_operations_by_ticker["BAC"].routine_confidence == 0.87
 
-    # Test JSON serialization
-    response_dict = response.model_dump()
-    assert "headline" in response_dict
-    assert "core_classification" in response_dict
-    assert "routine_operations_by_ticker" in response_dict
+    # Test JSON serialization round-trips the same structure
+    response_dict = json.loads(response.model_dump_json())
     assert response_dict["headline"] == "Test headline"
     assert response_dict["core_classification"]["is_straight_news"] is True
     assert "BAC" in response_dict["routine_operations_by_ticker"]
@@ -716,7 +662,7 @@ def test_multi_ticker_routine_request_empty_headline_rejected():
     """Test MultiTickerRoutineRequest rejects empty headline."""
     from benz_sent_filter.models.classification import MultiTickerRoutineRequest
 
-    with pytest.raises(ValidationError) as exc_info:
+    with pytest.raises(ValidationError, match=_HEADLINE_FIELD_RE) as exc_info:
         MultiTickerRoutineRequest(
             headline="",
             ticker_symbols=["BAC"],
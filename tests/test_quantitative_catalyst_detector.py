@@ -4,17 +4,46 @@ Tests MNLI-based presence detection and regex value extraction.
 Phase 1: Core detector without type classification.
 """
 
+import re
+import sys
+
 import pytest
 
 from benz_sent_filter.services.quantitative_catalyst_detector_mnls import (
     QuantitativeCatalystDetectorMNLS,
 )
 
+# Value assertions: one compiled scan per extracted value instead of several
+# substring checks plus a lower() copy
+_PER_SHARE_3750_RE = re.compile(r"(?=.*37\.50)(?=.*(?:share|/))", re.IGNORECASE)
+_PER_SHARE_10_RE = re.compile(r"(?=.*10)(?=.*share)", re.IGNORECASE)
+_DECIMAL_175_RE = re.compile(r"1\.75")
+
+
+def any_value_matches(values: list[str], pattern: re.Pattern) -> bool:
+    """Return True if any extracted value matches the compiled pattern."""
+    return any(pattern.search(value) for value in values)
+
+
+@pytest.fixture
+def detector(quantitative_detector):
+    """Session-wide real-model detector (see conftest.quantitative_detector)."""
+    return quantitative_detector
+
 
 @pytest.fixture
-def detector():
-    """Create detector instance for testing."""
-    return QuantitativeCatalystDetectorMNLS()
+def counting_detector():
+    """Detector over a fake pipeline that records every sequence it scores."""
+    calls = []
+
+    def fake_pipeline(sequences, candidate_labels):
+        calls.extend(sequences if isinstance(sequences, list) else [sequences])
+        output = {"labels": candidate_labels, "scores": [0.9, 0.1]}
+        if isinstance(sequences, list):
+            return [output for _ in sequences]
+        return output
+
+    return QuantitativeCatalystDetectorMNLS(pipeline=fake_pipeline), calls
 
 
 class TestPresenceDetection:
@@ -80,6 +109,16 @@ class TestPresenceDetection:
 class TestValueExtraction:
     """Test regex value extraction patterns."""
 
+    def test_regex_patterns_precompiled(self):
+        """Extraction patterns are compiled once at class definition."""
+        for pattern in (
+            QuantitativeCatalystDetectorMNLS.DOLLAR_PATTERN,
+            QuantitativeCatalystDetectorMNLS.PER_SHARE_PATTERN,
+            QuantitativeCatalystDetectorMNLS.PERCENTAGE_PATTERN,
+            QuantitativeCatalystDetectorMNLS.FINANCIAL_KEYWORDS,
+        ):
+            assert isinstance(pattern, re.Pattern)
+
     def test_extract_simple_dollar_amount(self, detector):
         """Extract simple dollar amount like $1."""
         headline = "Company Declares $1 Dividend"
@@ -108,7 +147,7 @@ class TestValueExtraction:
 
         # Should extract the per-share price
         values = result.catalyst_values
-        assert any("37.50" in v and ("share" in v.lower() or "/" in v) for v in values)
+        assert any_value_matches(values, _PER_SHARE_3750_RE)
 
     def test_extract_per_share_price_words(self, detector):
         """Extract per-share prices with 'per share' format."""
@@ -117,7 +156,7 @@ class TestValueExtraction:
 
         # Should extract the per-share price
         values = result.catalyst_values
-        assert any("10" in v and "share" in v.lower() for v in values) or "$10" in values
+        assert any_value_matches(values, _PER_SHARE_10_RE) or "$10" in values
 
     def test_extract_multiple_values(self, detector):
         """Extract multiple dollar values from same headline."""
@@ -292,4 +331,132 @@ class TestEdgeCases:
 
         # Should extract the decimal amount
         values = result.catalyst_values
-        assert any("1.75" in v for v in values)
+        assert any_value_matches(values, _DECIMAL_175_RE)
+
+
+class TestBatchDetection:
+    """Test batched detection runs MNLI once per stage for all headlines."""
+
+    BATCH_HEADLINES = [
+        "Universal Safety Declares $1 Special Dividend",
+        "Company Updates Strategic Outlook",
+        "",
+        "Sompo To Acquire Aspen For $3.5B",
+        None,
+        "Riskified Board Authorizes Repurchase Of Up To $75M",
+    ]
+
+    @pytest.fixture(scope="class")
+    def batch_results(self, detector):
+        """Run the whole batch through the detector once."""
+        return detector.detect_batch(self.BATCH_HEADLINES)
+
+    def test_batch_preserves_length_and_order(self, batch_results):
+        """One result per input headline, in input order."""
+        assert len(batch_results) == len(self.BATCH_HEADLINES)
+        assert [r.headline for r in batch_results] == [
+            h or "" for h in self.BATCH_HEADLINES
+        ]
+
+    def test_batch_handles_empty_and_none(self, batch_results):
+        """Empty and None headlines yield negative results inside a batch."""
+        for index in (2, 4):
+            assert batch_results[index].has_quantitative_catalyst is False
+            assert batch_results[index].catalyst_values == []
+            assert batch_results[index].confidence == 0.0
+
+    def test_batch_matches_single_detection(self, detector, batch_results):
+        """Batched results agree with per-headline detect()."""
+        for headline, batch_result in zip(self.BATCH_HEADLINES, batch_results):
+            single = detector.detect(headline)
+            assert batch_result.has_quantitative_catalyst == single.has_quantitative_catalyst
+            assert batch_result.catalyst_type == single.catalyst_type
+            assert batch_result.catalyst_values == single.catalyst_values
+            assert batch_result.confidence == pytest.approx(single.confidence, abs=1e-4)
+
+    def test_batch_types(self, batch_results):
+        """Catalyst types are classified per headline within a batch."""
+        assert batch_results[0].catalyst_type == "dividend"
+        assert batch_results[1].has_quantitative_catalyst is False
+        assert batch_results[3].catalyst_type == "acquisition"
+        assert batch_results[5].catalyst_type == "buyback"
+
+
+class TestScoreCache:
+    """Test MNLI score caching for repeated headlines."""
+
+    def test_repeated_headline_reuses_scores(self, counting_detector):
+        """Second detection of the same headline makes no pipeline calls."""
+        detector, calls = counting_detector
+        headline = "Company Declares $1 Dividend"
+
+        first = detector.detect(headline)
+        calls_after_first = len(calls)
+        second = detector.detect(headline)
+
+        assert calls_after_first > 0
+        assert len(calls) == calls_after_first
+        assert second == first
+
+    def test_duplicates_in_batch_scored_once(self, counting_detector):
+        """Duplicate headlines within a batch are sent to the pipeline once."""
+        detector, calls = counting_detector
+        headline = "Company Declares $1 Dividend"
+
+        results = detector.detect_batch([headline, headline, headline])
+
+        assert len(results) == 3
+        # One presence call plus one call per catalyst type, each for one sequence
+        assert calls == [headline] * (1 + len(detector.CATALYST_TYPE_LABELS))
+
+    def test_cache_is_bounded(self, counting_detector):
+        """Cache evicts oldest entries beyond SCORE_CACHE_SIZE."""
+        detector, _ = counting_detector
+        detector._score_cache.max_size = 4
+
+        detector.detect_batch([f"Company Announces ${i}M Buyback" for i in range(10)])
+
+        assert len(detector._score_cache) <= 4
+
+
+class TestValueMarkerPrefilter:
+    """Test MNLI is skipped when a headline has no "$" or "%" values."""
+
+    def test_no_value_markers_skips_pipeline(self, counting_detector):
+        """Headlines without "$" or "%" return negative without MNLI calls."""
+        detector, calls = counting_detector
+
+        result = detector.detect("Company Provides Strategic Business Update")
+
+        assert calls == []
+        assert result.has_quantitative_catalyst is False
+        assert result.catalyst_values == []
+        assert result.confidence == 0.0
+
+    def test_value_markers_reach_pipeline(self, counting_detector):
+        """Headlines with "$" or "%" still go through MNLI."""
+        detector, calls = counting_detector
+
+        detector.detect_batch(
+            ["Company Declares $1 Dividend", "Dividend Yield Rises To 10%"]
+        )
+
+        assert "Company Declares $1 Dividend" in calls
+        assert "Dividend Yield Rises To 10%" in calls
+
+
+class TestPipelineCreation:
+    """Test construction of the detector's own pipeline."""
+
+    def test_falls_back_to_pytorch_without_onnx_runtime(
+        self, monkeypatch, mock_transformers_pipeline
+    ):
+        """Without optimum installed the regular transformers pipeline is used."""
+        # A None entry in sys.modules makes the import raise ImportError
+        monkeypatch.setitem(sys.modules, "optimum.onnxruntime", None)
+        mock_transformers_pipeline({QuantitativeCatalystDetectorMNLS.PRESENCE_LABELS[0]: 0.1})
+
+        detector = QuantitativeCatalystDetectorMNLS()
+        result = detector.detect("Company Declares $1 Dividend")
+
+        assert result.has_quantitative_catalyst is False
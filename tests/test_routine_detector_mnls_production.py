@@ -10,142 +10,176 @@ The goal is to have a complete picture of what the detector should and shouldn't
 flag as routine operations.
 """
 
+import sys
+import types
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
 import pytest
 
+from benz_sent_filter.services import routine_detector_mnls as routine_mnls_module
+from benz_sent_filter.services import zero_shot_pipeline
 from benz_sent_filter.services.routine_detector_mnls import (
     RoutineOperationDetectorMNLS,
 )
 
 
-@pytest.fixture
-def detector():
-    """Create a fresh detector instance for each test.
-
-    This ensures the MNLI pipeline is reset between tests to avoid
-    state leakage that can cause intermittent failures in the full suite.
-    """
-    return RoutineOperationDetectorMNLS()
-
-
-class TestProductionMaterialEventsNotRoutine:
-    """Test that clearly material events are NOT classified as routine.
-
-    These are regression tests based on actual production failures where
-    material events ($23B sales, $180M offerings, etc.) were incorrectly
-    marked as routine operations.
-    """
+@dataclass(frozen=True)
+class Case:
+    """Production regression headline and its expected classification."""
+
+    name: str
+    headline: str
+    symbol: Optional[str]
+    expect_routine: bool
+    max_confidence: Optional[float] = None
+
+
+CASES = [
+    # Material events that production misclassified as routine after the
+    # GENERAL_TOPIC fix (article ID and tickers noted per case)
+    Case(
+        # benzinga_47327444_SATS (SATS, T)
+        "echostar_23b_spectrum_sale",
+        "EchoStar To Sell 3.45 GHz And 600 MHz Spectrum Licenses To AT&T For $23B, "
+        "Establishes Hybrid MNO Agreement With Boost Mobile To Address FCC Inquiries",
+        None,
+        False,
+        0.5,
+    ),
+    Case(
+        # benzinga_47469914_SMR (SMR): multi-gigawatt deployment agreement
+        "nuscale_6gw_agreement",
+        "NuScale Power Supports ENTRA1 Energy's Agreement With Tennessee Valley Authority "
+        "To Deploy Up To 6 Gigawatts Of NuScale SMR Capacity Across TVA's Seven-State Service Region",
+        None,
+        False,
+    ),
+    Case(
+        # benzinga_47279040_ANTE (ANTE): $180M capital raise
+        "airnet_180m_offering",
+        "AirNet Technology Enters Registered Direct Offering For Sale Of 80,826,225 "
+        "Ordinary Shares And Accompanying Warrants At Combined Purchase Price Of $2.227; "
+        "Gross Proceeds $180M",
+        None,
+        False,
+        0.5,
+    ),
+    Case(
+        # benzinga_47181720_RCAT (LTRX, RCAT): no dollar amount, but selection
+        # for a U.S. Army program is a significant strategic win
+        "lantronix_army_program",
+        "Lantronix's TAA- And NDAA-Compliant Solution Selected By Teal Drones For "
+        "Production Of Black Widow Drones Under U.S. Army's Short-Range Reconnaissance Program",
+        None,
+        False,
+    ),
+    Case(
+        # benzinga_47088121_IBRX (IBRX): complete responses are significant
+        # events for biotech companies
+        "immunitybio_trial_results",
+        "ImmunityBio Announces Early QUILT-106 Phase I Data Showing Complete Responses "
+        "In Waldenstrom Macroglobulinemia Patients Treated With CD19 CAR-NK Therapy",
+        None,
+        False,
+    ),
+    # Routine operations
+    Case(
+        "quarterly_dividend",
+        "Bank announces quarterly dividend payment",
+        None,
+        True,
+    ),
+    Case(
+        "sec_filing",
+        "Bank files quarterly MBS disclosure report with SEC",
+        None,
+        True,
+    ),
+    Case(
+        # FNMA context: $560M / $4T assets = 0.014% << 0.5% threshold
+        "fnma_560m_loan_sale",
+        "Fannie Mae Begins Marketing Its Most Recent Sale Of Reperforming Loans; "
+        "Sale Consists Of ~ 3,058 Loans, Having An Unpaid Principal Balance Of ~ $560.5M",
+        "FNMA",
+        True,
+    ),
+]
+
+MATERIAL_CASES = [case for case in CASES if not case.expect_routine]
+ROUTINE_CASES = [case for case in CASES if case.expect_routine]
 
-    def test_echostar_23b_spectrum_sale_not_routine(self, detector):
-        """$23B spectrum license sale should be material, not routine.
 
-        Article: benzinga_47327444_SATS
-        Tickers: SATS, T
-        Issue: Incorrectly classified as routine after GENERAL_TOPIC fix
-        """
-        headline = (
-            "EchoStar To Sell 3.45 GHz And 600 MHz Spectrum Licenses To AT&T For $23B, "
-            "Establishes Hybrid MNO Agreement With Boost Mobile To Address FCC Inquiries"
-        )
-
-        result = detector.detect(headline)
-
-        # $23B transaction is material, not routine
-        assert result.result is False, (
-            f"$23B spectrum sale should be MATERIAL, not routine. "
-            f"Got routine_operation={result.result}, confidence={result.confidence:.2f}"
-        )
-        # Confidence should be low for routine classification
-        assert result.confidence < 0.5, (
-            f"Routine confidence should be low (<0.5) for $23B sale. "
-            f"Got {result.confidence:.2f}"
-        )
+@pytest.fixture
+def counting_detector(monkeypatch):
+    """Detector over a fake pipeline that records every sequence it scores."""
+    calls = []
 
-    def test_nuscale_power_agreement_not_routine(self, detector):
-        """Major 6 GW deployment agreement should be material, not routine.
+    def fake_pipeline(sequences, candidate_labels):
+        calls.extend(sequences if isinstance(sequences, list) else [sequences])
+        output = {"labels": candidate_labels, "scores": [0.9, 0.1]}
+        if isinstance(sequences, list):
+            return [output for _ in sequences]
+        return output
 
-        Article: benzinga_47469914_SMR
-        Tickers: SMR
-        Issue: Incorrectly classified as routine after GENERAL_TOPIC fix
-        """
-        headline = (
-            "NuScale Power Supports ENTRA1 Energy's Agreement With Tennessee Valley Authority "
-            "To Deploy Up To 6 Gigawatts Of NuScale SMR Capacity Across TVA's Seven-State Service Region"
-        )
+    monkeypatch.setattr(
+        routine_mnls_module,
+        "create_zero_shot_pipeline",
+        lambda model_name, quantize=False: fake_pipeline,
+    )
+    return RoutineOperationDetectorMNLS(), calls
 
-        result = detector.detect(headline)
 
-        # Major multi-gigawatt deployment agreement is material
-        assert result.result is False, (
-            f"6 GW deployment agreement should be MATERIAL, not routine. "
-            f"Got routine_operation={result.result}, confidence={result.confidence:.2f}"
-        )
-
-    def test_airnet_180m_offering_not_routine(self, detector):
-        """$180M capital raise should be material, not routine.
-
-        Article: benzinga_47279040_ANTE
-        Tickers: ANTE
-        Issue: Incorrectly classified as routine after GENERAL_TOPIC fix
-        """
-        headline = (
-            "AirNet Technology Enters Registered Direct Offering For Sale Of 80,826,225 "
-            "Ordinary Shares And Accompanying Warrants At Combined Purchase Price Of $2.227; "
-            "Gross Proceeds $180M"
-        )
-
-        result = detector.detect(headline)
+@pytest.fixture
+def detector(routine_detector_mnls):
+    """Session-wide MNLS detector (see conftest.routine_detector_mnls).
 
-        # $180M capital raise is material, not routine
-        assert result.result is False, (
-            f"$180M capital raise should be MATERIAL, not routine. "
-            f"Got routine_operation={result.result}, confidence={result.confidence:.2f}"
-        )
-        assert result.confidence < 0.5, (
-            f"Routine confidence should be low (<0.5) for $180M offering. "
-            f"Got {result.confidence:.2f}"
-        )
+    The detector's only state between calls is its score cache, which is
+    cleared here so each test scores its headlines from scratch and results
+    cannot depend on test order; only the model load is shared.
+    """
+    routine_detector_mnls._score_cache.clear()
+    return routine_detector_mnls
 
-    def test_lantronix_defense_contract_not_routine(self, detector):
-        """Military drone program selection should be material, not routine.
 
-        Article: benzinga_47181720_RCAT
-        Tickers: LTRX, RCAT
-        Note: While this doesn't have a specific dollar amount, being selected for
-        a U.S. Army program is a significant strategic win.
-        """
-        headline = (
-            "Lantronix's TAA- And NDAA-Compliant Solution Selected By Teal Drones For "
-            "Production Of Black Widow Drones Under U.S. Army's Short-Range Reconnaissance Program"
-        )
+@pytest.fixture(scope="module")
+def regression_results(routine_detector_mnls):
+    """Results for every regression case, keyed by case name.
 
-        result = detector.detect(headline)
+    All CASES go through one detect_batch() call, so the suite costs a single
+    batched forward pass instead of one per test. The shared score cache is
+    cleared first so no earlier test's scores are reused.
+    """
+    routine_detector_mnls._score_cache.clear()
+    results = routine_detector_mnls.detect_batch(
+        [case.headline for case in CASES], [case.symbol for case in CASES]
+    )
+    return {case.name: result for case, result in zip(CASES, results)}
 
-        # U.S. Army program selection is material
-        assert result.result is False, (
-            f"U.S. Army program selection should be MATERIAL, not routine. "
-            f"Got routine_operation={result.result}, confidence={result.confidence:.2f}"
-        )
 
-    def test_immunitybio_clinical_trial_results_not_routine(self, detector):
-        """Positive clinical trial results (complete responses) should be material.
+class TestProductionMaterialEventsNotRoutine:
+    """Test that clearly material events are NOT classified as routine.
 
-        Article: benzinga_47088121_IBRX
-        Tickers: IBRX
-        Note: Clinical trial results showing complete responses are significant events
-        for biotech companies.
-        """
-        headline = (
-            "ImmunityBio Announces Early QUILT-106 Phase I Data Showing Complete Responses "
-            "In Waldenstrom Macroglobulinemia Patients Treated With CD19 CAR-NK Therapy"
-        )
+    These are regression tests based on actual production failures where
+    material events ($23B sales, $180M offerings, etc.) were incorrectly
+    marked as routine operations.
+    """
 
-        result = detector.detect(headline)
+    @pytest.mark.parametrize("case", MATERIAL_CASES, ids=lambda case: case.name)
+    def test_material_event_not_routine(self, regression_results, case):
+        """Material event is not routine, with low confidence where bounded."""
+        result = regression_results[case.name]
 
-        # Clinical trial complete responses are material
         assert result.result is False, (
-            f"Clinical trial complete responses should be MATERIAL, not routine. "
+            f"{case.name} should be MATERIAL, not routine. "
             f"Got routine_operation={result.result}, confidence={result.confidence:.2f}"
         )
+        if case.max_confidence is not None:
+            assert result.confidence < case.max_confidence, (
+                f"Routine confidence should be low (<{case.max_confidence}) "
+                f"for {case.name}. Got {result.confidence:.2f}"
+            )
 
 
 class TestRoutineDetectorTransactionExtraction:
@@ -191,51 +225,243 @@ class TestRoutineOperationsShouldBeRoutine:
     - Standard loan portfolio sales (for financial institutions)
     """
 
-    def test_quarterly_dividend_is_routine(self, detector):
-        """Quarterly dividend should be routine for established companies."""
-        headline = "Bank announces quarterly dividend payment"
-
-        result = detector.detect(headline)
+    @pytest.mark.parametrize("case", ROUTINE_CASES, ids=lambda case: case.name)
+    def test_routine_operation_is_routine(self, regression_results, case):
+        """Routine operation is classified as routine."""
+        result = regression_results[case.name]
 
-        # Quarterly dividend is routine
         assert result.result is True, (
-            f"Quarterly dividend should be ROUTINE. "
-            f"Got routine_operation={result.result}, confidence={result.confidence:.2f}"
+            f"{case.name} should be ROUTINE. "
+            f"Got routine_operation={result.result}, confidence={result.confidence:.2f}, "
+            f"materiality_ratio={result.materiality_ratio}"
         )
 
-    def test_sec_filing_is_routine(self, detector):
-        """Routine SEC filing should be classified as routine."""
-        headline = "Bank files quarterly MBS disclosure report with SEC"
+
+class TestDetectBatch:
+    """Test batched detection against single-headline detection."""
+
+    def test_detect_batch_matches_detect(self, detector):
+        """Batched results match per-headline detect() results."""
+        headlines = [
+            "Bank announces quarterly dividend payment",
+            "",
+            (
+                "Fannie Mae Begins Marketing Its Most Recent Sale Of Reperforming Loans; "
+                "Sale Consists Of ~ 3,058 Loans, Having An Unpaid Principal Balance Of ~ $560.5M"
+            ),
+        ]
+        symbols = [None, None, "FNMA"]
+
+        results = detector.detect_batch(headlines, symbols)
+
+        assert len(results) == len(headlines)
+        for headline, symbol, result in zip(headlines, symbols, results):
+            expected = detector.detect(headline, company_symbol=symbol)
+            assert result.result is expected.result
+            assert result.confidence == pytest.approx(expected.confidence, abs=1e-4)
+            assert result.transaction_value == expected.transaction_value
+            assert result.materiality_score == expected.materiality_score
+
+    def test_detect_batch_empty_list(self, detector):
+        """Empty batch returns empty list without running the model."""
+        assert detector.detect_batch([]) == []
+
+
+class TestScoreCache:
+    """Test MNLS score caching for repeated headlines."""
+
+    # Below HARD_MATERIALITY_FLOOR, so MNLS runs with or without a symbol
+    FNMA_HEADLINE = "Fannie Mae Begins Marketing Sale Of Reperforming Loans; ~ $56.5M"
+
+    def test_repeated_headline_reuses_score(self, counting_detector):
+        """Second detection of the same headline makes no pipeline calls."""
+        detector, calls = counting_detector
+
+        first = detector.detect(self.FNMA_HEADLINE)
+        second = detector.detect(self.FNMA_HEADLINE)
+
+        assert calls == [self.FNMA_HEADLINE]
+        assert second == first
+
+    def test_cached_score_reassessed_per_company_symbol(self, counting_detector):
+        """Materiality is still computed for each symbol on a cached score."""
+        detector, calls = counting_detector
+
+        without_symbol = detector.detect(self.FNMA_HEADLINE)
+        with_symbol = detector.detect(self.FNMA_HEADLINE, company_symbol="FNMA")
+
+        assert calls == [self.FNMA_HEADLINE]
+        assert without_symbol.materiality_score is None
+        assert with_symbol.materiality_score == -2
+        assert with_symbol.result is True
+
+    def test_duplicates_in_batch_scored_once(self, counting_detector):
+        """Duplicate headlines within a batch are sent to the pipeline once."""
+        detector, calls = counting_detector
+
+        results = detector.detect_batch([self.FNMA_HEADLINE] * 3)
+
+        assert len(results) == 3
+        assert calls == [self.FNMA_HEADLINE]
+
+    def test_cache_is_bounded(self, counting_detector):
+        """Cache evicts oldest entries beyond SCORE_CACHE_SIZE."""
+        detector, _ = counting_detector
+        detector._score_cache.max_size = 4
+
+        detector.detect_batch([f"Bank Announces ${i}M Buyback" for i in range(10)])
+
+        assert len(detector._score_cache) == 4
+
+
+class TestHardMaterialityFloor:
+    """Test large transactions without company context skip MNLS."""
+
+    def test_large_transaction_material_without_pipeline(self, counting_detector):
+        """$23B sale with no company context is material and never hits MNLS."""
+        detector, calls = counting_detector
+        headline = "EchoStar To Sell Spectrum Licenses To AT&T For $23B"
 
         result = detector.detect(headline)
 
-        # SEC filing is routine
-        assert result.result is True, (
-            f"SEC filing should be ROUTINE. "
-            f"Got routine_operation={result.result}, confidence={result.confidence:.2f}"
+        assert calls == []
+        assert result.result is False
+        assert result.confidence == 0.0
+        assert result.transaction_value == 23_000_000_000
+        assert result.detected_patterns == ["hard_materiality_floor"]
+
+    def test_large_transaction_with_company_context_uses_materiality(
+        self, counting_detector
+    ):
+        """Company context takes precedence: $560.5M is routine for FNMA."""
+        detector, calls = counting_detector
+        headline = "Fannie Mae Begins Marketing Sale Of Reperforming Loans; ~ $560.5M"
+
+        result = detector.detect(headline, company_symbol="FNMA")
+
+        assert calls == [headline]
+        assert result.materiality_score == -2
+        assert result.result is True
+
+    def test_transaction_below_floor_uses_pipeline(self, counting_detector):
+        """Transactions below the floor are still classified by MNLS."""
+        detector, calls = counting_detector
+        headline = "Bank Announces $50M Share Repurchase"
+
+        detector.detect(headline)
+
+        assert calls == [headline]
+
+    def test_detect_batch_applies_floor_per_headline(self, counting_detector):
+        """Only headlines below the floor are sent to the batched MNLS call."""
+        detector, calls = counting_detector
+        headlines = [
+            "AirNet Technology Offering; Gross Proceeds $180M",
+            "Bank Announces $50M Share Repurchase",
+        ]
+
+        results = detector.detect_batch(headlines)
+
+        assert calls == [headlines[1]]
+        assert results[0].detected_patterns == ["hard_materiality_floor"]
+        assert results[1].detected_patterns == ["mnls_classification"]
+
+
+class TestPipelineCreation:
+    """Test construction of the detector's own pipeline."""
+
+    @pytest.fixture
+    def failing_optimum(self, monkeypatch, tmp_path):
+        """Stub optimum whose export always fails; records export attempts."""
+        attempts = []
+
+        class FailingORTModel:
+            @classmethod
+            def from_pretrained(cls, *args, **kwargs):
+                attempts.append(args)
+                raise OSError("export failed")
+
+        onnxruntime = types.ModuleType("optimum.onnxruntime")
+        onnxruntime.ORTModelForSequenceClassification = FailingORTModel
+        onnxruntime.ORTOptimizer = onnxruntime.ORTQuantizer = object
+        configuration = types.ModuleType("optimum.onnxruntime.configuration")
+        configuration.AutoQuantizationConfig = configuration.OptimizationConfig = object
+        monkeypatch.setitem(sys.modules, "optimum.onnxruntime", onnxruntime)
+        monkeypatch.setitem(
+            sys.modules, "optimum.onnxruntime.configuration", configuration
+        )
+        monkeypatch.setattr(zero_shot_pipeline, "ONNX_CACHE_DIR", tmp_path)
+        return attempts
+
+    @pytest.mark.parametrize("quantize", [False, True])
+    def test_falls_back_to_pytorch_without_onnx_runtime(
+        self, monkeypatch, mock_transformers_pipeline, quantize
+    ):
+        """Without optimum installed the regular transformers pipeline is used."""
+        monkeypatch.setattr(zero_shot_pipeline, "ONNX_RUNTIME", True)
+        # A None entry in sys.modules makes the import raise ImportError
+        monkeypatch.setitem(sys.modules, "optimum.onnxruntime", None)
+        mock_transformers_pipeline(
+            {RoutineOperationDetectorMNLS.ROUTINE_LABELS[1]: 0.9}
         )
 
-    def test_fnma_loan_sale_560m_is_routine_for_fnma(self, detector):
-        """$560M loan sale is routine for FNMA given its $4T asset base.
+        detector = RoutineOperationDetectorMNLS(quantize=quantize)
+        result = detector.detect("Bank announces quarterly dividend payment")
 
-        Example from test_api.py
-        FNMA context: $4T assets, so $560M is 0.014% of assets (immaterial)
-        """
-        headline = (
-            "Fannie Mae Begins Marketing Its Most Recent Sale Of Reperforming Loans; "
-            "Sale Consists Of ~ 3,058 Loans, Having An Unpaid Principal Balance Of ~ $560.5M"
+        assert result.result is True
+
+    def test_pytorch_used_unless_onnx_opted_in(
+        self, monkeypatch, failing_optimum, mock_transformers_pipeline
+    ):
+        """An installed optimum is ignored unless ONNX_RUNTIME is enabled."""
+        monkeypatch.setattr(zero_shot_pipeline, "ONNX_RUNTIME", False)
+        mock_transformers_pipeline(
+            {RoutineOperationDetectorMNLS.ROUTINE_LABELS[1]: 0.9}
         )
 
-        result = detector.detect(headline, company_symbol="FNMA")
+        detector = RoutineOperationDetectorMNLS()
+        result = detector.detect("Bank announces quarterly dividend payment")
 
-        # With FNMA context, this should be routine due to materiality threshold
-        # $560M / $4T assets = 0.014% << 0.5% threshold
-        assert result.result is True, (
-            f"$560M loan sale should be ROUTINE for FNMA ($4T assets). "
-            f"Got routine_operation={result.result}, confidence={result.confidence:.2f}, "
-            f"materiality_ratio={result.materiality_ratio}"
+        assert result.result is True
+        assert failing_optimum == []
+
+    def test_failed_export_falls_back_without_leaving_files(
+        self, monkeypatch, tmp_path, failing_optimum, mock_transformers_pipeline
+    ):
+        """An export error uses PyTorch and leaves no partial files in the cache."""
+        monkeypatch.setattr(zero_shot_pipeline, "ONNX_RUNTIME", True)
+        mock_transformers_pipeline(
+            {RoutineOperationDetectorMNLS.ROUTINE_LABELS[1]: 0.9}
         )
 
+        detector = RoutineOperationDetectorMNLS()
+        result = detector.detect("Bank announces quarterly dividend payment")
+
+        assert result.result is True
+        assert len(failing_optimum) == 1
+        assert list(tmp_path.iterdir()) == []
+
+    def test_publish_moves_marker_file_last(self, monkeypatch, tmp_path):
+        """Staged files are published with the marker file moved last."""
+        staging = tmp_path / "staging"
+        staging.mkdir()
+        for name in ("model.onnx", "config.json", "tokenizer.json"):
+            (staging / name).write_text(name)
+        moved = []
+        replace = zero_shot_pipeline.os.replace
+
+        def recording_replace(src, dst):
+            moved.append(Path(dst).name)
+            replace(src, dst)
+
+        monkeypatch.setattr(zero_shot_pipeline.os, "replace", recording_replace)
+
+        zero_shot_pipeline._publish(staging, tmp_path / "export", "model.onnx")
+
+        assert moved[-1] == "model.onnx"
+        assert sorted(moved) == ["config.json", "model.onnx", "tokenizer.json"]
+        assert list(staging.iterdir()) == []
+
 
 # ============================================================================
 # COMPREHENSIVE SUMMARY - All Test Cases
@@ -289,5 +515,6 @@ PROPOSED SOLUTIONS:
 ===================
 1. Improve MNLI labels to focus on investor materiality
 2. Add pre-filtering for large transactions (>$100M automatically material)
+   → Implemented as HARD_MATERIALITY_FLOOR when no company context is available
 3. Better incorporate transaction value into final classification
 """
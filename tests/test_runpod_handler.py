@@ -1,80 +1,170 @@
 """Tests for RunPod serverless handler."""
 
 import sys
-from unittest.mock import MagicMock
+import types
 
 import pytest
 
-
-@pytest.fixture
-def handler_module(mock_transformers_pipeline, monkeypatch):
-    """Import handler module with mocked transformers pipeline and runpod."""
-    # Mock runpod module before import
-    mock_runpod = MagicMock()
-    monkeypatch.setitem(sys.modules, "runpod", mock_runpod)
-    monkeypatch.setitem(sys.modules, "runpod.serverless", mock_runpod.serverless)
-
-    # Set up mock scores
-    mock_transformers_pipeline(
-        {
-            "This is an opinion piece or editorial": 0.3,
-            "This is a factual news report": 0.7,
-            "This is about a past event that already happened": 0.6,
-            "This is about a future event or forecast": 0.2,
-            "This is a general topic or analysis": 0.2,
-        }
-    )
-
-    # Clear module cache to force fresh import with mocked pipeline
-    modules_to_clear = [
-        "benz_sent_filter.runpod_handler",
-        "benz_sent_filter.services.classifier",
-        "benz_sent_filter.services.routine_detector_mnls",
-        "benz_sent_filter.services.quantitative_catalyst_detector_mnls",
-        "benz_sent_filter.services.strategic_catalyst_detector_mnls",
-    ]
-    for module_name in modules_to_clear:
-        if module_name in sys.modules:
-            del sys.modules[module_name]
-
-    # Import handler module (triggers service initialization)
-    from benz_sent_filter import runpod_handler
-
-    return runpod_handler
-
-
-def test_handler_classify_single_headline(handler_module):
-    """Test handler processes classify operation for single headline."""
-    job = {"input": {"operation": "classify", "headline": "Apple announces new iPhone"}}
-
-    result = handler_module.handler(job)
-
+# MNLI scores returned by the fake pipeline for the classification labels
+HANDLER_SCORES = {
+    "This is an opinion piece or editorial": 0.3,
+    "This is a factual news report": 0.7,
+    "This is about a past event that already happened": 0.6,
+    "This is about a future event or forecast": 0.2,
+    "This is a general topic or analysis": 0.2,
+}
+
+# Exact ValueError messages raised by the handler for invalid jobs
+ERRORS = {
+    "invalid_operation": "Invalid operation: invalid_operation",
+    "missing_operation": "Missing required field 'operation'",
+    "missing_headline_classify": "Missing required field 'headline' for classify operation",
+    "missing_headlines_batch": (
+        "Missing required field 'headlines' for classify_batch operation"
+    ),
+    "missing_ticker_symbols": (
+        "Missing required field 'ticker_symbols' for routine_operations operation"
+    ),
+    "missing_company_relevance": (
+        "Missing required field 'company' for company_relevance operation"
+    ),
+}
+
+# Keys every item of a batch response must carry
+REQUIRED_CLASSIFY = frozenset({"is_opinion", "is_straight_news", "temporal_category"})
+REQUIRED_COMPANY_RELEVANCE = frozenset({"is_about_company", "company_score"})
+
+# Modules that bind transformers.pipeline at import time or build services
+# at import time, re-imported so they pick up the fake pipeline
+HANDLER_MODULES = [
+    "benz_sent_filter.runpod_handler",
+    "benz_sent_filter.services.classifier",
+    "benz_sent_filter.services.routine_detector_mnls",
+    "benz_sent_filter.services.quantitative_catalyst_detector_mnls",
+    "benz_sent_filter.services.strategic_catalyst_detector_mnls",
+]
+
+
+def fake_zero_shot(text, candidate_labels, **kwargs):
+    """Zero-shot stand-in scoring each label from HANDLER_SCORES."""
+    scores = [HANDLER_SCORES.get(label, 0.2) for label in candidate_labels]
+    # Mirror transformers: a list of sequences returns a list of results
+    if isinstance(text, list):
+        return [{"labels": candidate_labels, "scores": scores} for _ in text]
+    return {"labels": candidate_labels, "scores": scores}
+
+
+def fake_pipeline(task, model=None, **kwargs):
+    """transformers.pipeline stand-in returning fake_zero_shot."""
+    return fake_zero_shot
+
+
+def _assert_dict_schema(result, keys=frozenset(), types=None):
+    """Assert result is a dict holding every key in keys and in types.
+
+    Args:
+        result: Handler output to check
+        keys: Keys that must be present (any value)
+        types: Optional mapping of key to the type its value must have
+    """
+    types = types or {}
     assert isinstance(result, dict)
-    assert "is_opinion" in result
-    assert "is_straight_news" in result
-    assert "temporal_category" in result
-    assert "scores" in result
-    assert result["is_straight_news"] is True
-    assert result["temporal_category"] == "past_event"
-
-
-def test_handler_classify_with_company(handler_module):
-    """Test handler processes classify operation with company parameter."""
-    job = {
-        "input": {
-            "operation": "classify",
-            "headline": "Apple announces new iPhone",
-            "company": "Apple",
-        }
-    }
-
-    result = handler_module.handler(job)
-
-    assert isinstance(result, dict)
-    assert "is_about_company" in result
-    assert "company_score" in result
-    assert isinstance(result["is_about_company"], bool)
-    assert isinstance(result["company_score"], float)
+    missing = (set(keys) | types.keys()) - result.keys()
+    assert not missing, f"Missing keys: {sorted(missing)}"
+    for key, expected_type in types.items():
+        assert isinstance(result[key], expected_type), key
+
+
+@pytest.fixture(scope="module")
+def handler_module():
+    """Import handler module with fake transformers pipeline and runpod.
+
+    The handler builds its ClassificationService at import time; importing it
+    once per module (instead of once per test) builds the services once. The
+    handler is stateless between jobs, so tests share it. All patches,
+    including the sys.modules evictions, are undone after the module.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        # Stub runpod module before import (the handler only needs
+        # runpod.serverless.start, and only when run as a script)
+        runpod = types.ModuleType("runpod")
+        runpod.serverless = types.ModuleType("runpod.serverless")
+        runpod.serverless.start = lambda config: None
+        mp.setitem(sys.modules, "runpod", runpod)
+        mp.setitem(sys.modules, "runpod.serverless", runpod.serverless)
+        mp.setattr("transformers.pipeline", fake_pipeline)
+
+        # Clear module cache to force fresh import with the fake pipeline
+        for module_name in HANDLER_MODULES:
+            mp.delitem(sys.modules, module_name, raising=False)
+
+        # Import handler module (triggers service initialization)
+        from benz_sent_filter import runpod_handler
+
+        yield runpod_handler
+
+
+@pytest.mark.parametrize(
+    "job_input,keys,types,values",
+    [
+        pytest.param(
+            {"operation": "classify", "headline": "Apple announces new iPhone"},
+            {"is_opinion", "temporal_category", "scores"},
+            {},
+            {"is_straight_news": True, "temporal_category": "past_event"},
+            id="classify",
+        ),
+        pytest.param(
+            {
+                "operation": "classify",
+                "headline": "Apple announces new iPhone",
+                "company": "Apple",
+            },
+            set(),
+            {"is_about_company": bool, "company_score": float},
+            {},
+            id="classify_with_company",
+        ),
+        pytest.param(
+            {
+                "operation": "company_relevance",
+                "headline": "Apple announces new iPhone",
+                "company": "Apple",
+            },
+            {"is_about_company", "company_score"},
+            {},
+            {"company": "Apple"},
+            id="company_relevance",
+        ),
+        pytest.param(
+            # Other fields may or may not be present depending on detection
+            {
+                "operation": "detect_quantitative_catalyst",
+                "headline": "Company declares $1.50 quarterly dividend",
+            },
+            {"headline"},
+            {"has_quantitative_catalyst": bool},
+            {},
+            id="detect_quantitative_catalyst",
+        ),
+        pytest.param(
+            {
+                "operation": "detect_strategic_catalyst",
+                "headline": "Company appoints new CEO",
+            },
+            {"headline"},
+            {"has_strategic_catalyst": bool},
+            {},
+            id="detect_strategic_catalyst",
+        ),
+    ],
+)
+def test_handler_operation(handler_module, job_input, keys, types, values):
+    """Test handler returns the expected response dict for each operation."""
+    result = handler_module.handler({"input": job_input})
+
+    _assert_dict_schema(result, keys | values.keys(), types)
+    assert {key: result[key] for key in values} == values
 
 
 def test_handler_classify_batch(handler_module):
@@ -94,10 +184,7 @@ def test_handler_classify_batch(handler_module):
 
     assert isinstance(result, list)
     assert len(result) == 3
-    for item in result:
-        assert "is_opinion" in item
-        assert "is_straight_news" in item
-        assert "temporal_category" in item
+    assert all(REQUIRED_CLASSIFY <= item.keys() for item in result)
 
 
 def test_handler_routine_operations(handler_module):
@@ -112,33 +199,12 @@ def test_handler_routine_operations(handler_module):
 
     result = handler_module.handler(job)
 
-    assert isinstance(result, dict)
-    assert "core_classification" in result
-    assert "routine_operations_by_ticker" in result
-    assert isinstance(result["core_classification"], dict)
-    assert isinstance(result["routine_operations_by_ticker"], dict)
+    _assert_dict_schema(
+        result, types={"core_classification": dict, "routine_operations_by_ticker": dict}
+    )
     assert "BAC" in result["routine_operations_by_ticker"]
 
 
-def test_handler_company_relevance(handler_module):
-    """Test handler processes company_relevance operation."""
-    job = {
-        "input": {
-            "operation": "company_relevance",
-            "headline": "Apple announces new iPhone",
-            "company": "Apple",
-        }
-    }
-
-    result = handler_module.handler(job)
-
-    assert isinstance(result, dict)
-    assert "is_about_company" in result
-    assert "company_score" in result
-    assert "company" in result
-    assert result["company"] == "Apple"
-
-
 def test_handler_company_relevance_batch(handler_module):
     """Test handler processes company_relevance_batch operation."""
     job = {
@@ -156,82 +222,48 @@ def test_handler_company_relevance_batch(handler_module):
 
     assert isinstance(result, list)
     assert len(result) == 2
-    for item in result:
-        assert "is_about_company" in item
-        assert "company_score" in item
-
-
-def test_handler_detect_quantitative_catalyst(handler_module):
-    """Test handler processes detect_quantitative_catalyst operation."""
-    job = {
-        "input": {
-            "operation": "detect_quantitative_catalyst",
-            "headline": "Company declares $1.50 quarterly dividend",
-        }
-    }
-
-    result = handler_module.handler(job)
-
-    assert isinstance(result, dict)
-    assert "has_quantitative_catalyst" in result
-    assert "headline" in result
-    # These fields may or may not be present depending on detection
-    assert isinstance(result["has_quantitative_catalyst"], bool)
-
-
-def test_handler_detect_strategic_catalyst(handler_module):
-    """Test handler processes detect_strategic_catalyst operation."""
-    job = {
-        "input": {
-            "operation": "detect_strategic_catalyst",
-            "headline": "Company appoints new CEO",
-        }
-    }
-
-    result = handler_module.handler(job)
-
-    assert isinstance(result, dict)
-    assert "has_strategic_catalyst" in result
-    assert "headline" in result
-    assert isinstance(result["has_strategic_catalyst"], bool)
+    assert all(REQUIRED_COMPANY_RELEVANCE <= item.keys() for item in result)
 
 
 def test_handler_invalid_operation(handler_module):
     """Test handler raises error for invalid operation."""
     job = {"input": {"operation": "invalid_operation"}}
 
-    with pytest.raises(ValueError, match="Invalid operation: invalid_operation"):
+    with pytest.raises(ValueError) as exc_info:
         handler_module.handler(job)
 
+    assert str(exc_info.value) == ERRORS["invalid_operation"]
+
 
 def test_handler_missing_operation(handler_module):
     """Test handler raises error when operation field is missing."""
     job = {"input": {}}
 
-    with pytest.raises(ValueError, match="Missing required field 'operation'"):
+    with pytest.raises(ValueError) as exc_info:
         handler_module.handler(job)
 
+    assert str(exc_info.value) == ERRORS["missing_operation"]
+
 
 def test_handler_missing_headline_classify(handler_module):
     """Test handler raises error when headline is missing for classify operation."""
     job = {"input": {"operation": "classify"}}
 
-    with pytest.raises(
-        ValueError, match="Missing required field 'headline' for classify operation"
-    ):
+    with pytest.raises(ValueError) as exc_info:
         handler_module.handler(job)
 
+    assert str(exc_info.value) == ERRORS["missing_headline_classify"]
+
 
 def test_handler_missing_headlines_batch(handler_module):
     """Test handler raises error when headlines is missing for batch operation."""
     job = {"input": {"operation": "classify_batch"}}
 
-    with pytest.raises(
-        ValueError,
-        match="Missing required field 'headlines' for classify_batch operation",
-    ):
+    with pytest.raises(ValueError) as exc_info:
         handler_module.handler(job)
 
+    assert str(exc_info.value) == ERRORS["missing_headlines_batch"]
+
 
 def test_handler_missing_ticker_symbols(handler_module):
     """Test handler raises error when ticker_symbols is missing for routine_operations."""
@@ -242,12 +274,11 @@ def test_handler_missing_ticker_symbols(handler_module):
         }
     }
 
-    with pytest.raises(
-        ValueError,
-        match="Missing required field 'ticker_symbols' for routine_operations operation",
-    ):
+    with pytest.raises(ValueError) as exc_info:
         handler_module.handler(job)
 
+    assert str(exc_info.value) == ERRORS["missing_ticker_symbols"]
+
 
 def test_handler_missing_company_relevance(handler_module):
     """Test handler raises error when company is missing for company_relevance."""
@@ -258,8 +289,7 @@ def test_handler_missing_company_relevance(handler_module):
         }
     }
 
-    with pytest.raises(
-        ValueError,
-        match="Missing required field 'company' for company_relevance operation",
-    ):
+    with pytest.raises(ValueError) as exc_info:
         handler_module.handler(job)
+
+    assert str(exc_info.value) == ERRORS["missing_company_relevance"]